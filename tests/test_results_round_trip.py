@@ -0,0 +1,26 @@
+import math
+from pathlib import Path
+
+from utils.result_entry import ResultEntry
+from utils.results_data import ResultsData
+
+# One exported entry, with every field written by ResultEntry.__repr__ (including a NaN angle variance)
+LINE = ("/results/batch_100_pore_6/output_files/run_1/Ther_temp_0.5__Anne_step_100,"
+        "6,21.5,-29350.25,1.7225,392,196,0.0:0.0;21.5:21.5,12.5,12.0,0.0125,nan,1.25,0.85,-0.125,0.5,0.0,"
+        "1000,250,10,20,30,0.25,120.5,0.1205,True")
+
+
+def test_repr_round_trip() -> None:
+    entry = ResultEntry.from_string(LINE)
+    assert repr(entry) == LINE
+    assert entry.changing_vars == {"Thermalising temperature": 0.5, "Annealing steps": 100}
+    assert math.isnan(entry.angle_variance)
+    assert entry.consistent is True
+
+
+def test_export_round_trip(tmp_path: Path) -> None:
+    results_path = tmp_path.joinpath("results.csv")
+    results_path.write_text(f"{LINE}\n{LINE}\n")
+    export_path = tmp_path.joinpath("exported.csv")
+    ResultsData.from_file(results_path).export(export_path)
+    assert export_path.read_text() == f"{LINE}\n{LINE}\n"
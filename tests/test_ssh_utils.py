@@ -0,0 +1,23 @@
+import io
+
+from utils.ssh_utils import command_lines
+
+
+class FakeSSHClient:
+    def __init__(self, output: str) -> None:
+        self.output = output
+
+    def exec_command(self, command: str) -> tuple[None, io.StringIO, io.StringIO]:
+        return None, io.StringIO(self.output, newline=""), io.StringIO()
+
+
+def test_command_lines_strips_line_endings() -> None:
+    assert command_lines(FakeSSHClient("first\nsecond\r\n"), "ls") == ["first", "second"]
+
+
+def test_command_lines_keeps_final_line_without_newline() -> None:
+    assert command_lines(FakeSSHClient("first\r\nlast"), "ls") == ["first", "last"]
+
+
+def test_command_lines_no_output() -> None:
+    assert command_lines(FakeSSHClient(""), "ls") == []
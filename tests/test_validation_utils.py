@@ -0,0 +1,27 @@
+import io
+
+import pytest
+
+from utils.validation_utils import confirm, get_valid_int, get_valid_str
+
+
+def test_get_valid_int_from_list() -> None:
+    assert get_valid_int("Number\n", 1, 5, source=["x", "7", "3"]) == 3
+
+
+def test_get_valid_int_exit_string() -> None:
+    assert get_valid_int("Number\n", 1, 5, exit_string="q", source=["q"]) is None
+
+
+def test_get_valid_str_from_file() -> None:
+    answers = io.StringIO("bad/name\r\ngood_name\n")
+    assert get_valid_str("Name\n", forbidden_chars=["/"], source=answers) == "good_name"
+
+
+def test_confirm_from_file() -> None:
+    assert confirm(source=io.StringIO("maybe\nY\n")) is True
+
+
+def test_answers_run_out() -> None:
+    with pytest.raises(EOFError):
+        confirm(source=["maybe"])
@@ -0,0 +1,24 @@
+import pickle
+
+from utils.var import FloatVar, IntVar
+
+
+def test_equal_vars_share_a_hash() -> None:
+    var = IntVar(name="Random seed", value=1)
+    assert var == IntVar(name="Random seed", value=1)
+    assert hash(var) == hash(IntVar(name="Random seed", value=2))
+
+
+def test_values_and_kinds_tell_vars_apart() -> None:
+    var = IntVar(name="Random seed", value=1)
+    assert var != IntVar(name="Random seed", value=2)
+    assert var != FloatVar(name="Random seed", value=1)
+    assert len({frozenset([var]), frozenset([IntVar(name="Random seed", value=2)])}) == 2
+
+
+def test_pickle_round_trip() -> None:
+    var = FloatVar(name="Thermalising temperature", value=0.5, lower=0)
+    copy = pickle.loads(pickle.dumps(var))
+    assert copy == var
+    assert hash(copy) == hash(var)
+    assert copy.short_name == "Ther_temp"
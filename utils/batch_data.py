@@ -97,11 +97,11 @@ class BatchData:
             if not (confirm(f"Are you sure you want to submit {selected_batch.name} to {hostname}? (y/n)\n")):
                 continue
             try:
-                ssh = ssh_login_silent(username=username, hostname=hostname)
+                # Only checks the login works, the client stays cached for later use and is closed at exit
+                ssh_login_silent(username=username, hostname=hostname)
             except LogInException as e:
                 print(e)
                 return
-            ssh.close()
             selected_batch.submit(username, hostname, output_path, submit_script_path)
             self.log_batch(self.batches[option - 1])
             print(f"Batch {self.batches[option - 1].name} submitted successfully!")
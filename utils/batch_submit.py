@@ -134,7 +134,7 @@ def wait_for_completion(ssh: paramiko.SFTPClient, completion_flag_path: Path, cf
 
 def main() -> None:
     initialise_log()
-    ssh = None
+    sftp = None
     successful = True
     try:
         logging.info("Batch submit started")
@@ -210,7 +210,6 @@ def main() -> None:
             logging.info("Removing batch on server")
             sftp.remove(zip_path)
             sftp.remove(completion_flag_path)
-            ssh.close()
         except paramiko.SSHException as e:
             logging.error(f"An error occurred while removing the batch on the server: {e}")
             raise
@@ -229,8 +228,9 @@ def main() -> None:
         logging.error(f"An unexpected error occurred: {e}")
         successful = False
     finally:
-        if ssh is not None:
-            ssh.close()
+        # The SSH client is shared through ssh_login_silent's cache, which closes it at exit
+        if sftp is not None:
+            sftp.close()
         if successful:
             logging.info("Batch submit successful!")
 
@@ -17,6 +17,8 @@ from .var import Var
 
 T = TypeVar('T')
 
+BATCH_NAME_FORBIDDEN_CHARS: list[str] = [" ", "/", "\\"]  # Characters that would break a batch's file and folder paths
+
 
 def find_char_indexes(string: str, target_char: str, invert: bool = False) -> list[int]:
     """
@@ -190,7 +192,7 @@ def get_batch_name(batches_path: Path) -> str | None:
         UserCancelledError: if the user cancels entering a batch name
     """
     while True:
-        batch_name = get_valid_str("Enter a name for the batch ('c' to cancel)\n", forbidden_chars=[" ", "/", r"\\"],
+        batch_name = get_valid_str("Enter a name for the batch ('c' to cancel)\n", forbidden_chars=BATCH_NAME_FORBIDDEN_CHARS,
                                    lower=1, upper=40)
         if batch_name == "c":
             return None
@@ -3,6 +3,8 @@ from __future__ import annotations
 import copy
 from collections import deque
 from dataclasses import dataclass
+from enum import IntEnum
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -10,7 +12,9 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from matplotlib import gridspec
+from matplotlib.axes import Axes
 from matplotlib.colors import ListedColormap
+from matplotlib.figure import Figure
 
 from .bss_output_data import BSSOutputData
 from .custom_types import RELATIVE_ENERGY, BSSType
@@ -21,6 +25,7 @@ from .other_utils import (dict_to_string, get_polygon_area,
                           get_polygon_area_estimate, string_to_value)
 from .plotting_utils import (add_colourbar_2, arrowed_spines, format_axes,
                              get_ring_colours_4, remove_axes)
+from .stats_utils import ring_size_variances
 from .var import BondSelectionVar, BoolVar, FloatVar, IntVar, Var
 
 short_name_to_var: dict[str: Var] = {"Mini_ring_size": IntVar(name="Minimum ring size", lower=3),
@@ -39,6 +44,49 @@ short_name_to_var: dict[str: Var] = {"Mini_ring_size": IntVar(name="Minimum ring
                                      "Anal_writ_inte": IntVar(name="Analysis write interval", lower=0, is_table_relevant=False),
                                      "Writ_movi_file": BoolVar(name="Write movie file", is_table_relevant=False)}
 SIDE_LENGTH: float = 2.1580672
+SERIES_DTYPE = np.float32  # Per-step series are only plotted, so single precision is plenty
+MAX_PLOT_POINTS: int = 2000  # Per-step series longer than this are strided before plotting
+# Columns written by ResultEntry.__repr__ (one exported line per entry) and their types when read back, in the same order as
+# ResultEntry.from_string parses them
+IMPORT_COLUMNS: dict[str, type] = {"path": str, "pore_size": np.int64, "pore_distance": np.float64,
+                                   "energy": np.float64, "entropy": np.float64, "num_nodes": np.int64, "num_rings": np.int64,
+                                   "dimensions": str, "ring_area": np.float64, "ring_area_estimate": np.float64,
+                                   "bond_length_variance": np.float64, "angle_variance": np.float64,
+                                   "ring_area_variance": np.float64, "ring_size_variance": np.float64,
+                                   "pearsons": np.float64, "p6": np.float64, "aboave_weaire": np.float64,
+                                   "num_attemped_switches": np.int64, "num_accepted_switches": np.int64,
+                                   "num_failed_angle_checks": np.int64, "num_failed_bond_length_checks": np.int64,
+                                   "num_failed_energy_checks": np.int64, "acceptance_rate": np.float64,
+                                   "total_run_time": np.float64, "average_time_per_step": np.float64, "consistent": str}
+SHORT_REPR_TEMPLATE: str = "rings: {initial_num_rings}, pore size: {pore_size}, changing vars: {changing_vars}"
+STR_TEMPLATE: str = ("ResultEntry object:\n"
+                     "Path: {path}\n"
+                     "Changing vars: {changing_vars}\n"
+                     "Pore size: {pore_size}\t"
+                     "Pore distance: {pore_distance}\n"
+                     "Energy: {energy}\t"
+                     "Entropy: {entropy}\n"
+                     "Number of nodes: {num_nodes}\t"
+                     "Number of rings: {num_rings}\n"
+                     "Dimensions: {dimensions}\n"
+                     "Ring area: {ring_area}\t"
+                     "Ring area estimate: {ring_area_estimate}\n"
+                     "Bond length variance: {bond_length_variance}\t"
+                     "Angle variance: {angle_variance}\n"
+                     "Ring area variance: {ring_area_variance}\t"
+                     "Ring size variance: {ring_size_variance}\n"
+                     "Pearsons: {pearsons}\t"
+                     "Above Weaire: {aboave_weaire}\n")
+
+
+class StatsColumn(IntEnum):
+    """
+    Column indexes of the per-step series array held by a ResultEntry
+    """
+    ENERGY = 0
+    TEMPERATURE = 1
+    ENTROPY = 2
+    RING_SIZE_VARIANCE = 3
 
 
 def convert_dictionary_column(series: pd.Series, deliminator_1: str = ";", deliminator_2: str = ":") -> pd.Series:
@@ -48,6 +96,111 @@ def convert_dictionary_column(series: pd.Series, deliminator_1: str = ";", delim
     return series.apply(lambda x: {int(item.split(deliminator_2)[0]): float(item.split(deliminator_2)[1]) for item in x.split(deliminator_1)})
 
 
+def rolling_mean(array: np.ndarray, smoothing: int) -> np.ndarray:
+    """
+    Applies a moving average along the first axis of an array using cumulative sums. The first
+    smoothing - 1 values are averaged over the available values only, so this is equivalent to
+    pd.Series.rolling(window=smoothing, min_periods=1).mean()
+
+    The sums are accumulated in double precision and the result is cast back to the input's dtype
+
+    Args:
+        array: the array to smooth (1D or 2D, with rows as steps)
+        smoothing: the window size of the moving average
+
+    Returns:
+        the smoothed array, with the same shape and dtype as the input
+    """
+    smoothing = 1 if smoothing < 1 else smoothing
+    cumulative_sums = np.cumsum(array, axis=0, dtype=np.float64)
+    rolled = np.empty_like(cumulative_sums)
+    head = min(smoothing, len(array))
+    rolled[:head] = cumulative_sums[:head] / np.arange(1, head + 1).reshape((-1,) + (1,) * (array.ndim - 1))
+    rolled[smoothing:] = (cumulative_sums[smoothing:] - cumulative_sums[:-smoothing]) / smoothing
+    return rolled.astype(array.dtype, copy=False)
+
+
+def ring_distributions_to_array(series: pd.Series, deliminator_1: str = ";", deliminator_2: str = ":") -> np.ndarray:
+    """
+    Converts a series of ring size distribution strings into a dense 2D array of proportions
+
+    Args:
+        series: the series of strings, eg "3:0.1;6:0.8;9:0.1"
+        deliminator_1: the deliminator between ring size, proportion pairs
+        deliminator_2: the deliminator between ring sizes and proportions
+
+    Returns:
+        a (num_steps, max_ring_size + 1) array where each column is the proportion of that ring size
+    """
+    # Steps without a distribution (empty cells) get a row of zeros, and a series without steps gives an empty array
+    distributions = [get_ring_size_distribution(string, deliminator_1, deliminator_2) if string else {}
+                     for string in series.fillna("")]
+    max_ring_size = max((max(distribution, default=0) for distribution in distributions), default=-1)
+    proportions = np.zeros((len(distributions), max_ring_size + 1), dtype=np.float64)
+    for step, distribution in enumerate(distributions):
+        proportions[step, list(distribution.keys())] = list(distribution.values())
+    return proportions
+
+
+def get_plot_stride(num_points: int, max_points: int = MAX_PLOT_POINTS) -> int:
+    """
+    Gets the stride needed to reduce a series to at most max_points points for plotting
+
+    Args:
+        num_points: the number of points in the series
+        max_points: the maximum number of points to plot
+
+    Returns:
+        the stride to slice the series with (1 if it is already short enough)
+    """
+    return max(1, -(-num_points // max_points))
+
+
+def read_stats_series(stats_path: Path) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Reads the per-step data from a bss_stats.csv file into a single contiguous array
+
+    Args:
+        stats_path: the path to the bss_stats.csv file
+
+    Returns:
+        the steps and a (num_steps, 4) array of the energy, temperature, entropy and
+        ring size variance per step (as SERIES_DTYPE), with columns indexed by StatsColumn
+    """
+    df = pd.read_csv(stats_path, skiprows=3, skipfooter=4, usecols=[0, 1, 2, 3, 6], engine="python")
+    variances = ring_size_variances(ring_distributions_to_array(df.iloc[:, 4]))
+    # Variances are calculated in double precision and only downcast when stored
+    series = np.empty((len(df), len(StatsColumn)), dtype=SERIES_DTYPE)
+    series[:, StatsColumn.ENERGY] = df.iloc[:, 2]
+    series[:, StatsColumn.TEMPERATURE] = df.iloc[:, 1]
+    series[:, StatsColumn.ENTROPY] = df.iloc[:, 3]
+    series[:, StatsColumn.RING_SIZE_VARIANCE] = variances
+    return df.iloc[:, 0].to_numpy(), series
+
+
+@lru_cache(maxsize=1)
+def _create_draw_figure() -> tuple[Figure, Axes]:
+    return plt.subplots()
+
+
+def get_draw_figure() -> tuple[Figure, Axes]:
+    """
+    Gets the figure and axes used for drawing networks, creating them only if they
+    do not exist yet or have been closed so that repeated draws reuse the same figure
+
+    Returns:
+        the cached figure and its (cleared) axes, set as the current figure and axes
+    """
+    fig, ax = _create_draw_figure()
+    if not plt.fignum_exists(fig.number):
+        _create_draw_figure.cache_clear()
+        fig, ax = _create_draw_figure()
+    ax.cla()
+    plt.figure(fig.number)
+    plt.sca(ax)
+    return fig, ax
+
+
 def get_last_data_line(job_path: Path) -> list[str]:
     """
     Gets the last line of the bss_stats.csv file in the output_files directory of the job
@@ -413,6 +566,11 @@ class ResultEntry:
         self.batch_name = self.path.parents[2].name
         self.initial_num_rings = int(self.batch_name.split("_")[1])
         self.relative_energy = self.energy / self.num_nodes - RELATIVE_ENERGY
+        # Dimensions never change, so format them once rather than on every export
+        self._dimensions_str = array_2d_to_string(self.dimensions)
+        # Per-step data is only read from bss_stats.csv when first needed for plotting
+        self._steps: Optional[np.ndarray] = None
+        self._series: Optional[np.ndarray] = None
 
     @ staticmethod
     def from_path(job_path: Path) -> ResultEntry:
@@ -465,6 +623,28 @@ class ResultEntry:
                            float(data[23]), float(data[24]),      # total run time, average time per step
                            data[25].lower() == "true")            # consistent
 
+    @ staticmethod
+    def from_dataframe(data: pd.DataFrame) -> list[ResultEntry]:
+        """
+        Creates entries from a DataFrame of already parsed columns, as read with the names and types of IMPORT_COLUMNS.
+        This is the bulk equivalent of from_string
+
+        Args:
+            data: the DataFrame to read, with one row per entry
+
+        Returns:
+            the entries, in the same order as the rows
+        """
+        columns = {name: data[name].tolist() for name in IMPORT_COLUMNS}
+        columns["path"] = [Path(path) for path in columns["path"]]
+        columns["dimensions"] = [string_to_2d_array(string) for string in columns["dimensions"]]
+        columns["consistent"] = [string.lower() == "true" for string in columns["consistent"]]
+        changing_vars = [get_changing_vars_dict(get_changing_vars(path)) for path in columns["path"]]
+        # Every field after changing_vars is in IMPORT_COLUMNS order
+        return [ResultEntry(path, entry_changing_vars, *fields)
+                for path, entry_changing_vars, *fields in zip(columns["path"], changing_vars,
+                                                              *(columns[name] for name in list(IMPORT_COLUMNS)[1:]))]
+
     def plot_ring_sizes(self, smoothing: int = 20) -> None:
         smoothing = 1 if smoothing < 1 else smoothing
         bss_output_data = BSSOutputData(self.path.joinpath("output_files", "bss_stats.csv"))
@@ -481,7 +661,7 @@ class ResultEntry:
         extended_cmap = ListedColormap(extended_ring_colours)
         gs = gridspec.GridSpec(1, 2, width_ratios=[20, 1])
         ax = plt.subplot(gs[0])
-        format_axes(ax, "Ring Size", "Proportion", 0, max(bss_output_data.steps), 0, 1)
+        format_axes(ax, "Ring Size", "Proportion", 0, bss_output_data.steps[-1], 0, 1)
         ax.stackplot(bss_output_data.steps, *data, colors=extended_cmap.colors, edgecolor="none", antialiased=False)
 
         # Create a colorbar
@@ -492,31 +672,46 @@ class ResultEntry:
         df = pd.read_csv(self.path.joinpath("output_files", "bss_stats.csv"), skiprows=3, skipfooter=4, usecols=indexes, engine="python")
         return tuple(df.iloc[:, i] for i in range(df.shape[1]))
 
-    def get_entropy_data_fast(self, smoothing: int = 20) -> tuple[pd.Series, pd.Series]:
-        smoothing = 1 if smoothing < 1 else smoothing
-        steps, entropies = self.get_stats_data_fast([0, 3])  # steps and entropy are columns 0 and 3 respectively
-        entropies = entropies.rolling(window=smoothing, min_periods=1).mean()
-        return steps, entropies
+    def get_series(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Gets the steps and the (num_steps, 4) per-step series array, reading bss_stats.csv on first use
+        Steps are written in increasing order, so steps[-1] is the final step
+        """
+        if self._series is None:
+            self._steps, self._series = read_stats_series(self.path.joinpath("output_files", "bss_stats.csv"))
+        return self._steps, self._series
+
+    def get_smoothed_series(self, smoothing: int = 20) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Gets the steps and the per-step series array with a moving average applied to every column at once
+        """
+        steps, series = self.get_series()
+        return steps, rolling_mean(series, smoothing)
+
+    def get_column_data_fast(self, column: StatsColumn, smoothing: int = 20) -> tuple[np.ndarray, np.ndarray]:
+        steps, series = self.get_series()
+        return steps, rolling_mean(series[:, column], smoothing)
+
+    def get_entropy_data_fast(self, smoothing: int = 20) -> tuple[np.ndarray, np.ndarray]:
+        return self.get_column_data_fast(StatsColumn.ENTROPY, smoothing)
 
     def plot_entropy(self, smoothing: int = 20) -> None:
         steps, entropies = self.get_entropy_data_fast(smoothing)
         ax = plt.gca()
         ax.plot(steps, entropies)
-        format_axes(ax, "Step", "Ring Size Shannon Entropy", 0, max(steps), 0, None)
+        format_axes(ax, "Step", "Ring Size Shannon Entropy", 0, steps[-1], 0, None)
         remove_axes(ax)
         arrowed_spines(ax)
 
-    def get_pearsons_data_fast(self, smoothing: int = 20) -> tuple[pd.Series, pd.Series]:
-        smoothing = 1 if smoothing < 1 else smoothing
-        steps, entropies = self.get_stats_data_fast([0, 4])  # steps and pearsons are columns 0 and 4 respectively
-        entropies = entropies.rolling(window=smoothing, min_periods=1).mean()
-        return steps, entropies
+    def get_pearsons_data_fast(self, smoothing: int = 20) -> tuple[np.ndarray, np.ndarray]:
+        steps, pearsons = self.get_stats_data_fast([0, 4])  # steps and pearsons are columns 0 and 4 respectively
+        return steps.to_numpy(), rolling_mean(pearsons.to_numpy(dtype=SERIES_DTYPE), smoothing)
 
     def plot_pearsons(self, smoothing: int = 20) -> None:
         steps, pearsons = self.get_pearsons_data_fast(smoothing)
         ax = plt.gca()
         ax.plot(steps, pearsons)
-        format_axes(ax, "Step", "Pearson's Correlation Coefficient", 0, max(steps), -1, 1)
+        format_axes(ax, "Step", "Pearson's Correlation Coefficient", 0, steps[-1], -1, 1)
         remove_axes(ax)
         arrowed_spines(ax)
 
@@ -534,15 +729,20 @@ class ResultEntry:
         remove_axes(ax)
         arrowed_spines(ax)
 
+    def get_bond_angles_fast(self) -> np.ndarray:
+        """
+        Gets the bond angles of the final base network without making a BSSData object
+        """
+        base_node_coords = pd.read_csv(self.path.joinpath("output_files", "base_network_coords.txt"), sep=r"\s+", header=None).values
+        base_node_adjacency = read_adjacencies(self.path.joinpath("output_files", "base_network_connections.txt"))
+        return get_angles(base_node_coords, base_node_adjacency, self.dimensions)
+
     def plot_angle_distribution(self, num_bins: Optional[int] = None) -> float:
         """
         Plots the distribution of bond angles in the system and returns the Shannon entropy
         """
         num_bins = "auto" if num_bins is None else num_bins
-        base_node_coords = pd.read_csv(self.path.joinpath("output_files", "base_network_coords.txt"), sep=r"\s+", header=None).values
-        base_node_adjacency = read_adjacencies(self.path.joinpath("output_files", "base_network_connections.txt"))
-        bond_angles = get_angles(base_node_coords, base_node_adjacency, self.dimensions)
-        print(np.var(bond_angles))
+        bond_angles = self.get_bond_angles_fast()
         ax = plt.gca()
         counts, bin_edges = np.histogram(bond_angles, bins=num_bins, range=(0, 360), density=True)
         ax.hist(bond_angles, bins=num_bins, range=(0, 360), density=True)
@@ -556,83 +756,73 @@ class ResultEntry:
 
         return entropy
 
-    def get_energy_data_fast(self, smoothing: int = 20) -> tuple[pd.Series, pd.Series]:
-        smoothing = 1 if smoothing < 1 else smoothing
-        steps, energies = self.get_stats_data_fast([0, 2])
-
-        # Apply a moving average to the data
-        energies = energies.rolling(window=smoothing, min_periods=1).mean()
-        return steps, energies
-
-    def get_temperature_data_fast(self, smoothing: int = 20) -> tuple[pd.Series, pd.Series]:
-        smoothing = 1 if smoothing < 1 else smoothing
-        steps, temperatures = self.get_stats_data_fast([0, 1])
+    def get_energy_data_fast(self, smoothing: int = 20) -> tuple[np.ndarray, np.ndarray]:
+        return self.get_column_data_fast(StatsColumn.ENERGY, smoothing)
 
-        # Apply a moving average to the data
-        temperatures = temperatures.rolling(window=smoothing, min_periods=1).mean()
-        return steps, temperatures
+    def get_temperature_data_fast(self, smoothing: int = 20) -> tuple[np.ndarray, np.ndarray]:
+        return self.get_column_data_fast(StatsColumn.TEMPERATURE, smoothing)
 
     def plot_energy(self, smoothing: int = 20) -> None:
         steps, energies = self.get_energy_data_fast(smoothing)
         ax = plt.gca()
         ax.plot(steps, energies)
-        format_axes(ax, "Step", r"Energy ($\mathdefault{E_h}$)", 0, max(steps), 0, None)
+        format_axes(ax, "Step", r"Energy ($\mathdefault{E_h}$)", 0, steps[-1], 0, None)
         remove_axes(ax)
         arrowed_spines(ax)
 
     def plot_relative_energy(self, smoothing: int = 20) -> None:
         steps, energies = self.get_energy_data_fast(smoothing)
         ax = plt.gca()
-        ax.plot(steps, energies / self.num_nodes - RELATIVE_ENERGY)
-        format_axes(ax, "Step", r"Relative Energy ($\mathdefault{E_h Node^{-1}}$)", 0, max(steps), 0, None)
+        ax.plot(steps, self.to_relative_energies(energies))
+        format_axes(ax, "Step", r"Relative Energy ($\mathdefault{E_h Node^{-1}}$)", 0, steps[-1], 0, None)
         remove_axes(ax)
         arrowed_spines(ax)
 
-    def get_ring_size_variance_data_fast(self, smoothing: int = 20) -> tuple[pd.Series, ...]:
-        smoothing = 1 if smoothing < 1 else smoothing
-        steps, ring_distributions = self.get_stats_data_fast([0, 6])
-        ring_distributions = convert_dictionary_column(ring_distributions)
-
-        # Calculate variance for each distribution
-        variances = ring_distributions.apply(lambda d: sum((x - np.average(list(d.keys()), weights=list(d.values())))**2 * p for x, p in d.items()))
+    def to_relative_energies(self, energies: np.ndarray) -> np.ndarray:
+        """
+        Converts energies to relative energies per node. The energy per node and RELATIVE_ENERGY are of
+        similar size, so the subtraction is done in double precision before casting back to SERIES_DTYPE
+        """
+        energies_per_node = np.divide(energies, self.num_nodes, dtype=np.float64)
+        return np.subtract(energies_per_node, RELATIVE_ENERGY, out=energies_per_node).astype(SERIES_DTYPE)
 
-        variances = variances.rolling(window=smoothing, min_periods=1).mean()
-        return steps, variances
+    def get_ring_size_variance_data_fast(self, smoothing: int = 20) -> tuple[np.ndarray, np.ndarray]:
+        return self.get_column_data_fast(StatsColumn.RING_SIZE_VARIANCE, smoothing)
 
     def plot_ring_size_variance(self, smoothing: int = 20) -> None:
         steps, variances = self.get_ring_size_variance_data_fast(smoothing)
         ax = plt.gca()
         ax.plot(steps, variances)
-        format_axes(ax, "Step", "Ring Size Variance", 0, max(steps), 0, None)
+        format_axes(ax, "Step", "Ring Size Variance", 0, steps[-1], 0, None)
         remove_axes(ax)
         arrowed_spines(ax)
 
     def plot_ring_size_entropy_and_variance(self, smoothing: int = 20) -> None:
-        steps, entropies = self.get_entropy_data_fast(smoothing)
-        _, variances = self.get_ring_size_variance_data_fast(smoothing)
+        steps, series = self.get_smoothed_series(smoothing)
+        # Smoothed series are dense, so thin them out rather than rendering every step
+        stride = get_plot_stride(len(steps))
         ax = plt.gca()
-        ax.plot(steps, entropies, label="Entropy")
-        ax.plot(steps, variances, label="Variance")
-        format_axes(ax, "Step", "Ring Size Shannon Entropy and Variance", 0, max(steps), 0, None)
+        ax.plot(steps[::stride], series[::stride, StatsColumn.ENTROPY], label="Entropy")
+        ax.plot(steps[::stride], series[::stride, StatsColumn.RING_SIZE_VARIANCE], label="Variance")
+        format_axes(ax, "Step", "Ring Size Shannon Entropy and Variance", 0, steps[-1], 0, None)
         remove_axes(ax)
         arrowed_spines(ax)
-        ax.legend()
+        ax.legend(loc="upper right")
 
     def plot_all_per_step(self, smoothing: int = 20) -> None:
-        steps, energies = self.get_energy_data_fast(smoothing)
-        relative_energies = energies / self.num_nodes - RELATIVE_ENERGY
-        _, temperatures = self.get_temperature_data_fast(smoothing)
-        _, entropies = self.get_entropy_data_fast(smoothing)
-        _, variances = self.get_ring_size_variance_data_fast(smoothing)
+        steps, series = self.get_smoothed_series(smoothing)
+        relative_energies = self.to_relative_energies(series[:, StatsColumn.ENERGY])
+        # Smoothed series are dense, so thin them out rather than rendering every step
+        stride = get_plot_stride(len(steps))
         ax = plt.gca()
-        ax.plot(steps, relative_energies, label="Relative Energy ($\mathdefault{E_h Node^{-1}}$)")
-        ax.plot(steps, entropies, label="Ring Size Entropy")
-        ax.plot(steps, variances, label="Ring Size Variance")
-        ax.plot(steps, temperatures, label="Temperature", color="red")
-        format_axes(ax, "Step", "", 0, max(steps), 0, None)
+        ax.plot(steps[::stride], relative_energies[::stride], label="Relative Energy ($\mathdefault{E_h Node^{-1}}$)")
+        ax.plot(steps[::stride], series[::stride, StatsColumn.ENTROPY], label="Ring Size Entropy")
+        ax.plot(steps[::stride], series[::stride, StatsColumn.RING_SIZE_VARIANCE], label="Ring Size Variance")
+        ax.plot(steps[::stride], series[::stride, StatsColumn.TEMPERATURE], label="Temperature", color="red")
+        format_axes(ax, "Step", "", 0, steps[-1], 0, None)
         remove_axes(ax)
         arrowed_spines(ax)
-        ax.legend(fontsize="x-large")
+        ax.legend(loc="upper right", fontsize="x-large")
 
     def get_bss_data(self, enable_fixed_rings: bool = True) -> BSSData:
         if enable_fixed_rings:
@@ -642,41 +832,31 @@ class ResultEntry:
     def draw_network(self, enable_fixed_rings: bool = True) -> None:
         """
         Creates a BSSData object, attempts to recenter the fixed rings and then draws the network with the pretty figures method
+        onto a reused figure (see get_draw_figure)
         """
         bss_data = self.get_bss_data(enable_fixed_rings)
         bss_data._attempt_fixed_ring_recenter()
+        get_draw_figure()
         bss_data.draw_graph_pretty_figures()
 
     def short_repr(self) -> str:
-        return f"rings: {self.initial_num_rings}, pore size: {self.pore_size}, changing vars: {self.changing_vars}"
+        return SHORT_REPR_TEMPLATE.format_map(vars(self))
 
     def __repr__(self) -> str:
         return (f"{self.path},"
                 f"{self.pore_size},{self.pore_distance},"
                 f"{self.energy},{self.entropy},"
                 f"{self.num_nodes},{self.num_rings},"
-                f"{array_2d_to_string(self.dimensions)},"
+                f"{self._dimensions_str},"
                 f"{self.ring_area},{self.ring_area_estimate},"
                 f"{self.bond_length_variance},{self.angle_variance},"
                 f"{self.ring_area_variance},{self.ring_size_variance},"
-                f"{self.pearsons},{self.p6},{self.aboave_weaire}")
+                f"{self.pearsons},{self.p6},{self.aboave_weaire},"
+                f"{self.num_attemped_switches},{self.num_accepted_switches},"
+                f"{self.num_failed_angle_checks},{self.num_failed_bond_length_checks},"
+                f"{self.num_failed_energy_checks},{self.acceptance_rate},"
+                f"{self.total_run_time},{self.average_time_per_step},"
+                f"{self.consistent}")
 
     def __str__(self) -> str:
-        return ("ResultEntry object:\n"
-                f"Path: {self.path}\n"
-                f"Changing vars: {self.changing_vars}\n"
-                f"Pore size: {self.pore_size}\t"
-                f"Pore distance: {self.pore_distance}\n"
-                f"Energy: {self.energy}\t"
-                f"Entropy: {self.entropy}\n"
-                f"Number of nodes: {self.num_nodes}\t"
-                f"Number of rings: {self.num_rings}\n"
-                f"Dimensions: {self.dimensions}\n"
-                f"Ring area: {self.ring_area}\t"
-                f"Ring area estimate: {self.ring_area_estimate}\n"
-                f"Bond length variance: {self.bond_length_variance}\t"
-                f"Angle variance: {self.angle_variance}\n"
-                f"Ring area variance: {self.ring_area_variance}\t"
-                f"Ring size variance: {self.ring_size_variance}\n"
-                f"Pearsons: {self.pearsons}\t"
-                f"Above Weaire: {self.aboave_weaire}\n")
+        return STR_TEMPLATE.format_map(vars(self))
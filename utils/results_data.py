@@ -1,89 +1,274 @@
 from __future__ import annotations
 
-from collections import defaultdict
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import groupby
 from pathlib import Path
-from typing import Any, Callable, Generator, Optional
+from typing import Callable, Iterable, Literal, Optional
 
-import matplotlib.cm as cm
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-from matplotlib import gridspec
-from matplotlib import pyplot as plt
-from matplotlib.colors import Normalize
+from matplotlib import colormaps, gridspec
+from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.colors import Colormap, Normalize
 
 from .custom_types import RELATIVE_ENERGY, RELATIVE_ENTROPY, RELATIVE_PEARSONS
 from .other_utils import progress_tracker
 from .plotting_utils import (add_colourbar, arrowed_spines, format_axes,
                              remove_axes)
-from .result_entry import ResultEntry
+from .result_entry import IMPORT_COLUMNS, ResultEntry, rolling_mean
+from .stats_utils import grouped_mean_std
 
 plt.rcParams["font.family"] = "serif"
 plt.rcParams["font.serif"] = ["Latin Modern Roman"]
 
+ColumnFunction = Callable[[dict[str, np.ndarray]], np.ndarray]
 
-def calculate_average(data):
-    return {thermal_temp: {anneal_temp: {pore_size: np.mean(energies)
-                                         for pore_size, energies in pore_sizes.items()}
-                           for anneal_temp, pore_sizes in anneal_temps.items()}
-            for thermal_temp, anneal_temps in data.items()}
+LEMAITRE_PATH: Path = Path(__file__).parents[1].joinpath("lemaitre.txt")  # Maximum entropy solution for the Lemaitre plots
+READ_CHUNK_SIZE: int = 100_000  # Number of rows of a results file parsed at a time
+RASTERIZE_SCATTER_THRESHOLD: int = 5000  # Scatters with more points than this are rasterized
+WISTIA: Colormap = colormaps["Wistia"]  # Colours thermalising temperatures
+COOL: Colormap = colormaps["cool"]  # Colours annealing steps and temperatures
+NUM_ANGLE_BINS: int = 100  # Number of equal width bins between 0 and 360 degrees in the angle distribution
+
+# Columns of ResultsData.columns taken from each entry's changing variables (NaN if not varied)
+CHANGING_VAR_COLUMNS: dict[str, str] = {"thermal_temp": "Thermalising temperature",
+                                        "anneal_temp": "Annealing end temperature",
+                                        "anneal_steps": "Annealing steps"}
+# Columns of ResultsData.columns taken directly from ResultEntry attributes
+ATTRIBUTE_COLUMNS: dict[str, type] = {"pore_size": np.int64, "pore_distance": np.float64, "pore_concentration": np.float64,
+                                      "energy": np.float64, "entropy": np.float64, "num_nodes": np.int64, "num_rings": np.int64,
+                                      "ring_area": np.float64, "ring_area_estimate": np.float64,
+                                      "bond_length_variance": np.float64, "angle_variance": np.float64,
+                                      "ring_area_variance": np.float64, "ring_size_variance": np.float64,
+                                      "pearsons": np.float64, "p6": np.float64, "acceptance_rate": np.float64}
 
 
 def sort_data(avg_data):
-    return {(thermal_temp, anneal_temp): sorted([(pore_size, avg_data[thermal_temp][anneal_temp][pore_size])
-                                                 for pore_size in avg_data[thermal_temp][anneal_temp].keys()], key=lambda x: x[0])
-            for thermal_temp, anneal_temps in avg_data.items()
-            for anneal_temp in anneal_temps.keys()}
+    # avg_data is keyed by (thermal_temp, anneal_temp, pore_size) tuples, already in ascending order as given by mean_by
+    return {temps: [(pore_size, avg_data[(*temps, pore_size)]) for *_, pore_size in keys]
+            for temps, keys in groupby(avg_data.keys(), key=lambda key: key[:2])}
 
 
 def plot_data(temps, thermal_temps, anneal_temps, cmap):
-    for (thermal_temp, anneal_temp), avg_energies in temps.items():
-        pore_sizes, avg_energies = zip(*avg_energies)
-        color = cmap((thermal_temps.index(thermal_temp) + anneal_temps.index(anneal_temp) / len(anneal_temps)) / len(thermal_temps))
-        plt.plot(pore_sizes, avg_energies, color=color)
-    return pore_sizes
+    # thermal_temps and anneal_temps are sorted, so every pair's indexes can be found in one search each
+    temp_pairs = np.array(list(temps.keys()), dtype=np.float64)
+    thermal_indexes = np.searchsorted(thermal_temps, temp_pairs[:, 0])
+    anneal_indexes = np.searchsorted(anneal_temps, temp_pairs[:, 1])
+    colors = cmap((thermal_indexes + anneal_indexes / len(anneal_temps)) / len(thermal_temps))
+    lines = [np.array(avg_energies) for avg_energies in temps.values()]
+    add_line_collection(plt.gca(), [line[:, 0] for line in lines], [line[:, 1] for line in lines], colors)
+    return lines[-1][:, 0]
+
+
+def add_line_collection(ax: Axes, xs: Iterable[np.ndarray], ys: Iterable[np.ndarray], colors: np.ndarray, **kwargs) -> LineCollection:
+    """
+    Adds many lines to axes as a single collection, which is much cheaper to draw than one ax.plot call per line
+
+    Args:
+        ax: the axes to add the lines to
+        xs: the x coordinates of each line
+        ys: the y coordinates of each line
+        colors: the colour of each line
+        kwargs: any other keyword arguments for LineCollection
+
+    Returns:
+        the added collection
+    """
+    lines = LineCollection([np.column_stack((x, y)) for x, y in zip(xs, ys)], colors=colors, **kwargs)
+    ax.add_collection(lines)
+    ax.autoscale_view()
+    return lines
+
+
+def add_band_collection(ax: Axes, xs: Iterable[np.ndarray], lows: Iterable[np.ndarray], highs: Iterable[np.ndarray],
+                        colors: np.ndarray, **kwargs) -> PolyCollection:
+    """
+    Adds many shaded bands (as with ax.fill_between) to axes as a single collection
+
+    Args:
+        ax: the axes to add the bands to
+        xs: the x coordinates of each band
+        lows: the lower y coordinates of each band
+        highs: the upper y coordinates of each band
+        colors: the colour of each band
+        kwargs: any other keyword arguments for PolyCollection, eg alpha
+
+    Returns:
+        the added collection
+    """
+    bands = PolyCollection([np.concatenate((np.column_stack((x, low)), np.column_stack((x, high))[::-1]))
+                            for x, low, high in zip(xs, lows, highs)], facecolors=colors, edgecolors=colors, **kwargs)
+    ax.add_collection(bands)
+    ax.autoscale_view()
+    return bands
+
+
+def group_mean_std_columns(values: np.ndarray, *key_columns: np.ndarray) -> tuple[np.ndarray, ...]:
+    """
+    Calculates the mean and standard deviation of values for each unique combination of keys, as in group_mean_std,
+    but returns the keys as parallel arrays (sorted lexicographically) rather than tuples
+
+    Args:
+        values: the values to average, one per row
+        key_columns: 1D arrays of equal length to group by (must not contain NaN)
+
+    Returns:
+        one array of unique keys per key column, followed by the means and standard deviations
+    """
+    keys, means, stds = group_mean_std(values, *key_columns)
+    unique_key_columns = [np.array([key[i] for key in keys], dtype=column.dtype) for i, column in enumerate(key_columns)]
+    return (*unique_key_columns, means, stds)
+
+
+def split_by_first_key(first_keys: np.ndarray, *arrays: np.ndarray) -> tuple[np.ndarray, list[tuple[np.ndarray, ...]]]:
+    """
+    Splits parallel arrays that are sorted by their first key into one group per unique first key
+
+    Args:
+        first_keys: the sorted first key of each row
+        arrays: the arrays to split, parallel to first_keys
+
+    Returns:
+        the unique first keys, and a tuple of slices of each array for each of them
+    """
+    unique_keys, starts = np.unique(first_keys, return_index=True)
+    return unique_keys, list(zip(*(np.split(array, starts[1:]) for array in arrays)))
+
+
+# Functions passed to ResultsData's grouping methods take ResultsData.columns and return one value per entry
+def get_relative_energy(columns: dict[str, np.ndarray]) -> np.ndarray:
+    return columns["energy"] / columns["num_nodes"] - RELATIVE_ENERGY
+
+
+def get_angle_variance(columns: dict[str, np.ndarray]) -> np.ndarray:
+    return columns["angle_variance"]
+
+
+def get_relative_entropy(columns: dict[str, np.ndarray]) -> np.ndarray:
+    return columns["entropy"] - RELATIVE_ENTROPY
+
+
+def get_relative_pearsons(columns: dict[str, np.ndarray]) -> np.ndarray:
+    return columns["pearsons"] - RELATIVE_PEARSONS
 
 
-def get_relative_energy(entry: ResultEntry) -> float:
-    return entry.energy / entry.num_nodes - RELATIVE_ENERGY
+def get_lemaitre(columns: dict[str, np.ndarray]) -> np.ndarray:
+    return np.column_stack((columns["p6"], columns["ring_size_variance"]))
 
 
-def get_angle_variance(entry: ResultEntry) -> float:
-    return entry.angle_variance
+def get_bond_length_variance(columns: dict[str, np.ndarray]) -> np.ndarray:
+    return columns["bond_length_variance"]
 
 
-def get_relative_entropy(entry: ResultEntry) -> float:
-    return entry.entropy - RELATIVE_ENTROPY
+def get_acceptance_rate(columns: dict[str, np.ndarray]) -> np.ndarray:
+    return columns["acceptance_rate"]
 
 
-def get_relative_pearsons(entry: ResultEntry) -> float:
-    return entry.pearsons - RELATIVE_PEARSONS
+def group_labels(*key_columns: np.ndarray) -> tuple[list[tuple], np.ndarray]:
+    """
+    Labels each row by its unique combination of keys
 
+    Args:
+        key_columns: 1D arrays of equal length to group by (must not contain NaN)
 
-def get_lemaitre(entry: ResultEntry) -> tuple[float, float]:
-    return entry.p6, entry.ring_size_variance
+    Returns:
+        the unique key combinations in ascending order (as tuples of Python scalars of each column's type)
+        and the index of each row's combination within them
+    """
+    unique_keys, labels = np.unique(np.column_stack(key_columns), axis=0, return_inverse=True)
+    keys = list(zip(*(unique_keys[:, i].astype(column.dtype).tolist() for i, column in enumerate(key_columns))))
+    return keys, labels.reshape(-1)
 
 
-def get_bond_length_variance(entry: ResultEntry) -> float:
-    return entry.bond_length_variance
+def nest_groups(keys: list[tuple], values: Iterable) -> dict:
+    """
+    Nests values into dictionaries keyed by each element of their key in turn, eg {key_1: {key_2: value}}
 
+    Args:
+        keys: the key combination of each value, as given by group_labels
+        values: one value per key combination
 
-def get_angle_variance(entry: ResultEntry) -> float:
-    return entry.angle_variance
+    Returns:
+        the nested dictionaries
+    """
+    data = {}
+    for key, value in zip(keys, values):
+        level = data
+        for sub_key in key[:-1]:
+            level = level.setdefault(sub_key, {})
+        level[key[-1]] = value
+    return data
 
 
+def group_values(values: np.ndarray, *key_columns: np.ndarray, flat: bool = False) -> dict:
+    """
+    Groups values into nested dictionaries keyed by each key column in turn, eg {key_1: {key_2: values}}
+
+    Args:
+        values: the values to group, one per row
+        key_columns: 1D arrays of equal length to group by (must not contain NaN)
+        flat: whether to return a single dictionary keyed by tuples of keys, eg {(key_1, key_2): values}
+
+    Returns:
+        the (nested) dictionaries, with arrays of the grouped values at the innermost level
+    """
+    keys, labels = group_labels(*key_columns)
+    order = np.argsort(labels, kind="stable")
+    groups = np.split(values[order], np.cumsum(np.bincount(labels, minlength=len(keys)))[:-1])
+    return dict(zip(keys, groups)) if flat else nest_groups(keys, groups)
+
+
+def group_mean_std(values: np.ndarray, *key_columns: np.ndarray) -> tuple[list[tuple], np.ndarray, np.ndarray]:
+    """
+    Calculates the mean and (population) standard deviation of values for each unique combination of keys
+
+    Args:
+        values: the values to average, one per row
+        key_columns: 1D arrays of equal length to group by (must not contain NaN)
+
+    Returns:
+        the unique key combinations in ascending order, and the mean and standard deviation of each
+    """
+    keys, labels = group_labels(*key_columns)
+    means, stds = grouped_mean_std(labels, values, len(keys))
+    return keys, means, stds
+
+
+def _safe_from_path(job_path: Path) -> tuple[Path, Optional[ResultEntry], Optional[str]]:
+    """
+    Reads a job's result entry in a worker process, returning the error as a string rather than raising it
+    """
+    try:
+        return job_path, ResultEntry.from_path(job_path), None
+    except Exception as e:
+        return job_path, None, str(e)
+
+
+@lru_cache(maxsize=4)
 def import_maximum_entropy_solution(path: Path) -> tuple[np.ndarray, np.ndarray]:
-    p_6s = []
-    variances = []
+    """
+    Reads the p6 and ring size variance columns of a maximum entropy solution file, caching the result
+    since every Lemaitre plot reloads the same file
+
+    Args:
+        path: the path to the maximum entropy solution file
+
+    Returns:
+        read-only arrays of the p6s and ring size variances
+    """
     with path.open("r") as max_entropy_file:
         node_degrees = np.array([int(float(x)) for x in max_entropy_file.readline().strip().split()[:-1]])
         degree_6_index = np.where(node_degrees == 6)[0][0]
-        for line in max_entropy_file.readlines():
-            data = line.strip().split()
-            p_6s.append(float(data[degree_6_index]))
-            variances.append(float(data[-1]))
-    return np.array(p_6s), np.array(variances)
+        data = np.loadtxt(max_entropy_file, ndmin=2)
+    p_6s, variances = data[:, degree_6_index], data[:, -1]
+    p_6s.setflags(write=False)
+    variances.setflags(write=False)
+    return p_6s, variances
 
 
 @dataclass
@@ -91,84 +276,208 @@ class ResultsData:
     path: Path
     entries: list[ResultEntry] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        self._columns: Optional[dict[str, np.ndarray]] = None
+        self._entropy_matrix: Optional[tuple[np.ndarray, np.ndarray]] = None
+
+    @ property
+    def columns(self) -> dict[str, np.ndarray]:
+        """
+        Gets the entries as a struct of arrays (one array per column in CHANGING_VAR_COLUMNS and ATTRIBUTE_COLUMNS),
+        built in a single pass over the entries on first access. Changing variables an entry does not vary are NaN
+        """
+        if self._columns is None:
+            num_entries = len(self.entries)
+            columns = {name: np.empty(num_entries, dtype=np.float64) for name in CHANGING_VAR_COLUMNS}
+            columns.update({name: np.empty(num_entries, dtype=dtype) for name, dtype in ATTRIBUTE_COLUMNS.items()})
+            for i, entry in enumerate(self.entries):
+                for name, var_name in CHANGING_VAR_COLUMNS.items():
+                    value = entry.changing_vars.get(var_name)
+                    columns[name][i] = np.nan if value is None else value
+                for name in ATTRIBUTE_COLUMNS:
+                    columns[name][i] = getattr(entry, name)
+            self._columns = columns
+        return self._columns
+
+    def get_entropy_matrix(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Gets the steps and a (num_entries, num_steps) array of every entry's per-step entropy, read once on first access.
+        Series are truncated to the shortest one so they can be stacked
+        """
+        if self._entropy_matrix is None:
+            if not self.entries:
+                return np.empty(0, dtype=np.float64), np.empty((0, 0), dtype=np.float64)
+            series = [entry.get_entropy_data_fast(smoothing=1) for entry in self.entries]
+            num_steps = min(len(steps) for steps, _ in series)
+            self._entropy_matrix = (series[0][0][:num_steps], np.stack([entropies[:num_steps] for _, entropies in series]))
+        return self._entropy_matrix
+
+    def invalidate_columns(self) -> None:
+        """
+        Discards the cached columns and entropy matrix so they are rebuilt from the entries on next access
+        """
+        self._columns = None
+        self._entropy_matrix = None
+
+    def group_by(self, function: ColumnFunction, *column_names: str, flat: bool = False) -> dict:
+        """
+        Groups the result of a function on each entry by the given columns, skipping entries where any of them is NaN
+
+        Args:
+            function: the function giving the value of each entry from the columns
+            column_names: the names of the columns to group by, outermost first
+            flat: whether to return a single dictionary keyed by tuples of the columns' values
+
+        Returns:
+            nested dictionaries keyed by each column in turn, with arrays of function values at the innermost level
+        """
+        values, key_columns = self._get_grouping_columns(function, column_names)
+        return group_values(values, *key_columns, flat=flat)
+
+    def mean_std_by(self, function: ColumnFunction, *column_names: str) -> dict:
+        """
+        Calculates the mean and standard deviation of a function on each entry, grouped by the given columns
+        and skipping entries where any of them is NaN
+
+        Args:
+            function: the function giving the value of each entry from the columns
+            column_names: the names of the columns to group by, outermost first
+
+        Returns:
+            nested dictionaries keyed by each column in turn, with (mean, standard deviation) tuples at the innermost level
+        """
+        values, key_columns = self._get_grouping_columns(function, column_names)
+        keys, means, stds = group_mean_std(values, *key_columns)
+        return nest_groups(keys, zip(means.tolist(), stds.tolist()))
+
+    def mean_std_arrays(self, function: ColumnFunction, *column_names: str) -> tuple[np.ndarray, ...]:
+        """
+        Calculates the mean and standard deviation of a function on each entry as in mean_std_by,
+        but returns them as parallel arrays sorted lexicographically by the given columns
+
+        Args:
+            function: the function giving the value of each entry from the columns
+            column_names: the names of the columns to group by, outermost first
+
+        Returns:
+            one array of unique keys per column, followed by the means and standard deviations
+        """
+        values, key_columns = self._get_grouping_columns(function, column_names)
+        return group_mean_std_columns(values, *key_columns)
+
+    def mean_by(self, function: ColumnFunction, *column_names: str, flat: bool = False) -> dict:
+        """
+        Calculates the mean of a function on each entry, grouped by the given columns as in mean_std_by.
+        If flat, the means are returned in a single dictionary keyed by tuples of the columns' values
+        """
+        values, key_columns = self._get_grouping_columns(function, column_names)
+        keys, means, _ = group_mean_std(values, *key_columns)
+        return dict(zip(keys, means.tolist())) if flat else nest_groups(keys, means.tolist())
+
+    def _get_grouping_columns(self, function: ColumnFunction,
+                              column_names: tuple[str, ...]) -> tuple[np.ndarray, list[np.ndarray]]:
+        key_columns = [self.columns[name] for name in column_names]
+        mask = np.logical_and.reduce([~np.isnan(column) for column in key_columns])
+        return np.asarray(function(self.columns))[mask], [column[mask] for column in key_columns]
+
     @staticmethod
     def from_file(path: Path) -> ResultsData:
-        with path.open("r") as results_file:
-            return ResultsData(path, [ResultEntry.from_string(line.strip()) for line in results_file.readlines()])
+        entries = []
+        # Parse in chunks so only one chunk's DataFrame is held in memory alongside the entries
+        with pd.read_csv(path, header=None, names=list(IMPORT_COLUMNS), dtype=IMPORT_COLUMNS, engine="c",
+                         chunksize=READ_CHUNK_SIZE) as reader:
+            for chunk in reader:
+                entries.extend(ResultEntry.from_dataframe(chunk))
+        return ResultsData(path, entries)
 
     @staticmethod
     def gen_from_paths(job_paths: list[Path], save_path: Path) -> ResultsData:
         total = len(job_paths)
         entries = []
-        errored_path = save_path.parent.joinpath("errored_jobs.txt")
-        for job_path in progress_tracker(job_paths, total):
-            try:
-                entries.append(ResultEntry.from_path(job_path))
-            except Exception as e:
-                print(f"Failed to process {job_path}: {e}")
-                with errored_path.open("a") as errored_file:
-                    errored_file.write(f"{job_path}\t{e}\n")
+        errors = []
+        chunksize = max(1, total // (4 * (os.cpu_count() or 1)))
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(_safe_from_path, job_paths, chunksize=chunksize)
+            for job_path, entry, error in progress_tracker(results, total):
+                if error is None:
+                    entries.append(entry)
+                else:
+                    print(f"Failed to process {job_path}: {error}")
+                    errors.append(f"{job_path}\t{error}\n")
+        if errors:
+            with save_path.parent.joinpath("errored_jobs.txt").open("a") as errored_file:
+                errored_file.writelines(errors)
         return_data = ResultsData(save_path, entries)
         return_data.export()
         return return_data
 
     def export(self, path: Optional[Path] = None) -> None:
         output_path = self.path if path is None else path
+        self.invalidate_columns()
         with output_path.open("w") as output_file:
-            for entry in self.entries:
-                output_file.write(f"{repr(entry)}\n")
-
-    def data_by_therm_anneal_pore(self, function: Callable[[ResultEntry], Any]) -> dict:
-        data = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
-        for entry in self.entries:
-            thermal_temp = entry.changing_vars.get("Thermalising temperature")
-            anneal_temp = entry.changing_vars.get("Annealing end temperature")
-            if thermal_temp is not None and anneal_temp is not None:
-                data[thermal_temp][anneal_temp][entry.pore_size].append(function(entry))
-        return data
-
-    def data_by_therm_anneal(self, function: Callable[[ResultEntry], Any]) -> dict:
-        data = defaultdict(lambda: defaultdict(list))
-        for entry in self.entries:
-            thermal_temp = entry.changing_vars.get("Thermalising temperature")
-            anneal_temp = entry.changing_vars.get("Annealing end temperature")
-            if thermal_temp is not None and anneal_temp is not None:
-                data[thermal_temp][anneal_temp].append(function(entry))
-        return data
-
-    def data_by_therm_pore(self, function: Callable[[ResultEntry], Any]) -> dict:
-        data = defaultdict(lambda: defaultdict(list))
-        for entry in self.entries:
-            thermal_temp = entry.changing_vars.get("Thermalising temperature")
-            if thermal_temp is not None:
-                data[thermal_temp][entry.pore_size].append(function(entry))
-        return data
-
-    def data_by_therm_pore_fraction(self, function: Callable[[ResultEntry], Any]) -> dict:
-        data = defaultdict(lambda: defaultdict(list))
-        for entry in self.entries:
-            thermal_temp = entry.changing_vars.get("Thermalising temperature")
-            if thermal_temp is not None:
-                data[thermal_temp][entry.pore_concentration].append(function(entry))
-        return data
-
-    def data_by_therm_p6(self, function: Callable[[ResultEntry], Any]) -> dict:
-        data = defaultdict(lambda: defaultdict(list))
-        for entry in self.entries:
-            thermal_temp = entry.changing_vars.get("Thermalising temperature")
-            if thermal_temp is not None:
-                data[thermal_temp][entry.p6].append(function(entry))
-        return data
+            output_file.write("".join(f"{entry!r}\n" for entry in self.entries))
+
+    def data_by_therm_anneal_pore(self, function: ColumnFunction) -> dict:
+        return self.group_by(function, "thermal_temp", "anneal_temp", "pore_size", flat=True)
+
+    def data_by_therm_anneal(self, function: ColumnFunction) -> dict:
+        return self.group_by(function, "thermal_temp", "anneal_temp")
+
+    def data_by_therm_pore(self, function: ColumnFunction) -> dict:
+        return self.group_by(function, "thermal_temp", "pore_size")
+
+    def data_by_therm_pore_fraction(self, function: ColumnFunction) -> dict:
+        return self.group_by(function, "thermal_temp", "pore_concentration")
+
+    def data_by_therm_p6(self, function: ColumnFunction) -> dict:
+        return self.group_by(function, "thermal_temp", "p6")
+
+    def _plot_per_temperature_lines(self, function: ColumnFunction, x_column: str = "pore_size",
+                                    cmap: Colormap = WISTIA, error_style: Literal["none", "errorbar", "fill"] = "fill",
+                                    extremes_only: bool = False) -> tuple[Axes, np.ndarray]:
+        """
+        Plots the mean of a function on each entry against a column, with one line per thermalising temperature
+        and a colour bar of thermalising temperatures
+
+        Args:
+            function: the function giving the value of each entry from the columns
+            x_column: the name of the column to plot on the x-axis
+            cmap: the colour map to colour the temperatures with
+            error_style: how to show the standard deviations, as error bars, a shaded region, or not at all
+            extremes_only: whether to only plot the minimum and maximum temperatures
+
+        Returns:
+            the axes plotted on and the unique x values plotted
+        """
+        temperature_column, x_values, means, stds = self.mean_std_arrays(function, "thermal_temp", x_column)
+        # Take the band edges over every group at once rather than per temperature
+        temperatures, groups = split_by_first_key(temperature_column, x_values, means, stds, means - stds, means + stds)
+        gs = gridspec.GridSpec(1, 2, width_ratios=[20, 1])
+        ax = plt.subplot(gs[0])
+        remove_axes(ax)
+        if extremes_only:
+            temperatures, groups = temperatures[[0, -1]], [groups[0], groups[-1]]
+        # Normalize maps every temperature to 0 when there is only one, rather than dividing by a zero range
+        colors = cmap(Normalize(vmin=temperatures.min(), vmax=temperatures.max())(temperatures))
+        xs, ys, yerrs, lows, highs = zip(*groups)
+        add_line_collection(ax, xs, ys, colors)
+        if error_style == "errorbar":
+            for x, y, yerr, color in zip(xs, ys, yerrs, colors):
+                ax.errorbar(x, y, yerr=yerr, color=color, fmt='o')
+        elif error_style == "fill":
+            add_band_collection(ax, xs, lows, highs, colors, alpha=0.3)
+        colour_bar_axes = plt.subplot(gs[1])
+        add_colourbar(colour_bar_axes, cmap, temperatures.tolist(), " \n" + r"$\mathdefault{log_{10}(T_{thermal})}$")
+        return ax, np.unique(np.concatenate(xs))
 
     def plot_lemaitre(self) -> None:
         data = np.array([[entry.changing_vars.get("Thermalising temperature"), entry.p6, entry.ring_size_variance] for entry in self.entries])
-        cmap = cm.get_cmap("Wistia")
+        cmap = WISTIA
         norm = Normalize(vmin=np.min(data[:, 0]), vmax=np.max(data[:, 0]))
-        colors = cmap(norm(data[:, 0]))
         gs = gridspec.GridSpec(1, 2, width_ratios=[20, 1])
         ax = plt.subplot(gs[0])
-        ax.scatter(data[:, 1], data[:, 2], color=colors)
-        maximum_entropy_solution = import_maximum_entropy_solution(Path(__file__).parents[1].joinpath("lemaitre.txt"))
+        ax.scatter(data[:, 1], data[:, 2], c=data[:, 0], cmap=cmap, norm=norm, rasterized=len(data) > RASTERIZE_SCATTER_THRESHOLD)
+        maximum_entropy_solution = import_maximum_entropy_solution(LEMAITRE_PATH)
         ax.plot(*maximum_entropy_solution, label="Maximum Entropy Solution", color="black", linewidth=2)
         remove_axes(ax)
         format_axes(ax, r"$\mathdefault{p_6}$", "Ring Size Variance", 0, 1, 0, None)
@@ -178,14 +487,12 @@ class ResultsData:
 
     def plot_lemaitre_by_pore_size(self) -> None:
         data = np.array([[entry.pore_size, entry.p6, entry.ring_size_variance] for entry in self.entries])
-        data = data[np.argsort(data[:, 0])]
-        cmap = cm.get_cmap("cool")
+        cmap = COOL
         norm = Normalize(vmin=np.min(data[:, 0]), vmax=np.max(data[:, 0]))
-        colors = cmap(norm(data[:, 0]))
         gs = gridspec.GridSpec(1, 2, width_ratios=[20, 1])
         ax = plt.subplot(gs[0])
-        ax.scatter(data[:, 1], data[:, 2], color=colors)
-        maximum_entropy_solution = import_maximum_entropy_solution(Path(__file__).parents[1].joinpath("lemaitre.txt"))
+        ax.scatter(data[:, 1], data[:, 2], c=data[:, 0], cmap=cmap, norm=norm, rasterized=len(data) > RASTERIZE_SCATTER_THRESHOLD)
+        maximum_entropy_solution = import_maximum_entropy_solution(LEMAITRE_PATH)
         ax.plot(*maximum_entropy_solution, label="Maximum Entropy Solution", color="black", linewidth=2)
         remove_axes(ax)
         format_axes(ax, r"$\mathdefault{p_6}$", "Ring Size Variance", 0, 1, 0, None)
@@ -195,23 +502,22 @@ class ResultsData:
 
     def plot_lemaitre_avg(self) -> None:
         # Group data by temperature
-        grouped_data = {}
-        for entry in self.entries:
-            temp = entry.changing_vars.get("Thermalising temperature")
-            if temp not in grouped_data:
-                grouped_data[temp] = {'p6': [], 'variance': []}
-            grouped_data[temp]['p6'].append(entry.p6)
-            grouped_data[temp]['variance'].append(entry.ring_size_variance)
+        columns = self.columns
+        has_temp = ~np.isnan(columns["thermal_temp"])
+        temps, labels = np.unique(columns["thermal_temp"][has_temp], return_inverse=True)
+        labels = labels.reshape(-1)
+        counts = np.bincount(labels)
         # Calculate averages
-        avg_data = np.array([[temp, np.mean(group['p6']), np.mean(group['variance'])] for temp, group in grouped_data.items()])
+        avg_data = np.column_stack((temps,
+                                    np.bincount(labels, weights=columns["p6"][has_temp]) / counts,
+                                    np.bincount(labels, weights=columns["ring_size_variance"][has_temp]) / counts))
         # Create color map
-        cmap = cm.get_cmap("Wistia")
+        cmap = WISTIA
         norm = Normalize(vmin=np.min(avg_data[:, 0]), vmax=np.max(avg_data[:, 0]))
-        colors = cmap(norm(avg_data[:, 0]))
         gs = gridspec.GridSpec(1, 2, width_ratios=[20, 1])
         ax = plt.subplot(gs[0])
-        ax.scatter(avg_data[:, 1], avg_data[:, 2], color=colors)
-        maximum_entropy_solution = import_maximum_entropy_solution(Path(__file__).parents[1].joinpath("lemaitre.txt"))
+        ax.scatter(avg_data[:, 1], avg_data[:, 2], c=avg_data[:, 0], cmap=cmap, norm=norm)
+        maximum_entropy_solution = import_maximum_entropy_solution(LEMAITRE_PATH)
         ax.plot(*maximum_entropy_solution, label="Maximum Entropy Solution", color="black", linewidth=2)
         remove_axes(ax)
         format_axes(ax, r"$\mathdefault{p_6}$", "Ring Size Variance", 0, 1, 0, None)
@@ -220,12 +526,12 @@ class ResultsData:
         add_colourbar(colour_bar_axes, cmap, np.unique(avg_data[:, 0]), " \n" + r"$\mathdefault{log_{10}(T_{thermal})}$")
 
     def plot_energy_vs_pore_size(self) -> None:
-        data = self.data_by_therm_anneal_pore(get_relative_energy)
-        avg_data = calculate_average(data)
+        avg_data = self.mean_by(get_relative_energy, "thermal_temp", "anneal_temp", "pore_size", flat=True)
         temps = sort_data(avg_data)
-        thermal_temps = sorted(set(thermal_temp for thermal_temp, _ in temps.keys()))
+        # The temperature pairs are in ascending order, so the thermalising temperatures only need deduplicating
+        thermal_temps = list(dict.fromkeys(thermal_temp for thermal_temp, _ in temps.keys()))
         anneal_temps = sorted(set(anneal_temp for _, anneal_temp in temps.keys()))
-        cmap = cm.get_cmap("cool")
+        cmap = COOL
         gs = gridspec.GridSpec(1, 2, width_ratios=[20, 1])
         ax = plt.subplot(gs[0])
         remove_axes(ax)
@@ -238,188 +544,71 @@ class ResultsData:
 
     def plot_energy_vs_pore_size_2(self) -> None:
         # Dont consider annealing temperature
-        data = self.data_by_therm_pore(get_relative_energy)
-        data = {temperature: {pore: (np.mean(energies), np.std(energies)) for pore, energies in pore_sizes.items()}
-                for temperature, pore_sizes in data.items()}
-        cmap = cm.get_cmap("cool")
-        gs = gridspec.GridSpec(1, 2, width_ratios=[20, 1])
-        ax = plt.subplot(gs[0])
-        remove_axes(ax)
-        min_temp = min(data.keys())
-        temp_range = max(data.keys()) - min_temp
-        for temperature, pore_sizes in sorted(data.items()):
-            sorted_pore_sizes = dict(sorted(pore_sizes.items()))
-            color = cmap((temperature - min_temp) / temp_range)
-            ax.plot(list(sorted_pore_sizes.keys()), [mean for mean, std in sorted_pore_sizes.values()], color=color)
-        format_axes(ax, "Pore Size", r"Average Relative Energy ($\mathdefault{E_h Node^{-1}}$)", list(sorted_pore_sizes.keys()))
+        ax, pore_sizes = self._plot_per_temperature_lines(get_relative_energy, cmap=COOL, error_style="none")
+        format_axes(ax, "Pore Size", r"Average Relative Energy ($\mathdefault{E_h Node^{-1}}$)", pore_sizes[0], pore_sizes[-1])
         arrowed_spines(ax)
-        colour_bar_axes = plt.subplot(gs[1])
-        add_colourbar(colour_bar_axes, cmap, list(data.keys()), " \n" + r"$\mathdefault{log_{10}(T_{thermal})}$")
 
     def plot_entropy_vs_pore_size(self) -> None:
-        data = self.data_by_therm_pore(get_relative_entropy)
-        data = {temperature: {pore: (np.mean(energies), np.std(energies)) for pore, energies in pore_sizes.items()}
-                for temperature, pore_sizes in data.items()}
-        cmap = cm.get_cmap("Wistia")
-        gs = gridspec.GridSpec(1, 2, width_ratios=[20, 1])
-        ax = plt.subplot(gs[0])
-        remove_axes(ax)
-        min_temp = min(data.keys())
-        temp_range = max(data.keys()) - min_temp
-        for temperature, pore_sizes in sorted(data.items()):
-            sorted_pore_sizes = dict(sorted(pore_sizes.items()))
-            color = cmap((temperature - min_temp) / temp_range)
-            x = list(sorted_pore_sizes.keys())
-            y = [mean for mean, std in sorted_pore_sizes.values()]
-            yerr = [std for mean, std in sorted_pore_sizes.values()]
-            ax.plot(x, y, color=color)
-            ax.fill_between(x, [yi - err for yi, err in zip(y, yerr)], [yi + err for yi, err in zip(y, yerr)], color=color, alpha=0.3)
+        ax, _ = self._plot_per_temperature_lines(get_relative_entropy)
         format_axes(ax, "Pore Size", r"Average Ring Size Entropy")
         arrowed_spines(ax)
-        colour_bar_axes = plt.subplot(gs[1])
-        add_colourbar(colour_bar_axes, cmap, list(data.keys()), " \n" + r"$\mathdefault{log_{10}(T_{thermal})}$")
 
     def plot_energy_vs_pore_size_error_bars(self) -> None:
-        data = self.data_by_therm_pore(get_relative_energy)
-        data = {temperature: {pore: (np.mean(energies), np.std(energies)) for pore, energies in pore_sizes.items()}
-                for temperature, pore_sizes in data.items()}
-        cmap = cm.get_cmap("Wistia")
-
-        gs = gridspec.GridSpec(1, 2, width_ratios=[20, 1])
-        ax = plt.subplot(gs[0])
-        remove_axes(ax)
-        min_temp = min(data.keys())
-        temp_range = max(data.keys()) - min_temp
-        for temperature, pore_sizes in sorted(data.items()):
-            sorted_pore_sizes = dict(sorted(pore_sizes.items()))
-            color = cmap((temperature - min_temp) / temp_range)
-            ax.plot(list(sorted_pore_sizes.keys()), [mean for mean, std in sorted_pore_sizes.values()], color=color)
-            ax.errorbar(list(sorted_pore_sizes.keys()), [mean for mean, std in sorted_pore_sizes.values()],
-                        yerr=[std for mean, std in sorted_pore_sizes.values()], color=color, fmt='o')
-        format_axes(ax, "Pore Size", r"Average Relative Energy ($\mathdefault{E_h Node^{-1}}$)", list(sorted_pore_sizes.keys()))
+        ax, pore_sizes = self._plot_per_temperature_lines(get_relative_energy, error_style="errorbar")
+        format_axes(ax, "Pore Size", r"Average Relative Energy ($\mathdefault{E_h Node^{-1}}$)", pore_sizes[0], pore_sizes[-1])
         arrowed_spines(ax)
-        colour_bar_axes = plt.subplot(gs[1])
-        add_colourbar(colour_bar_axes, cmap, list(data.keys()), " \n" + r"$\mathdefault{log_{10}(T_{thermal})}$")
 
     def plot_energy_vs_pore_size_fill_between(self) -> None:
-        data = self.data_by_therm_pore(get_relative_energy)
-        data = {temperature: {pore: (np.mean(energies), np.std(energies)) for pore, energies in pore_sizes.items()}
-                for temperature, pore_sizes in data.items()}
-        max_pore_size = max(pore for pore_sizes in data.values() for pore in pore_sizes.keys())
-        cmap = cm.get_cmap("Wistia")
-        gs = gridspec.GridSpec(1, 2, width_ratios=[20, 1])
-        ax = plt.subplot(gs[0])
-        remove_axes(ax)
-        min_temp = min(data.keys())
-        temp_range = max(data.keys()) - min_temp
-        for temperature, pore_sizes in sorted(data.items()):
-            sorted_pore_sizes = dict(sorted(pore_sizes.items()))
-            color = cmap((temperature - min_temp) / temp_range)
-            x = list(sorted_pore_sizes.keys())
-            y = [mean for mean, std in sorted_pore_sizes.values()]
-            yerr = [std for mean, std in sorted_pore_sizes.values()]
-            ax.plot(x, y, color=color)
-            ax.fill_between(x, [yi - err for yi, err in zip(y, yerr)], [yi + err for yi, err in zip(y, yerr)], color=color, alpha=0.3)
-        format_axes(ax, "Pore Size", r"Average Relative Energy ($\mathdefault{E_h Node^{-1}}$)", 8, max_pore_size, 0, None)
+        ax, pore_sizes = self._plot_per_temperature_lines(get_relative_energy)
+        format_axes(ax, "Pore Size", r"Average Relative Energy ($\mathdefault{E_h Node^{-1}}$)", 8, pore_sizes[-1], 0, None)
         arrowed_spines(ax)
-        colour_bar_axes = plt.subplot(gs[1])
-        add_colourbar(colour_bar_axes, cmap, list(data.keys()), " \n" + r"$\mathdefault{log_{10}(T_{thermal})}$")
 
     def plot_energy_vs_pore_size_fill_between_2(self) -> None:
         # Only plot the minimum and maximum thermalising temperatures
-        data = self.data_by_therm_pore(get_relative_energy)
-        data = {temperature: {pore: (np.mean(energies), np.std(energies)) for pore, energies in pore_sizes.items()}
-                for temperature, pore_sizes in data.items()}
-        cmap = cm.get_cmap("Wistia")
-        gs = gridspec.GridSpec(1, 2, width_ratios=[20, 1])
-        ax = plt.subplot(gs[0])
-        remove_axes(ax)
-        min_temp = min(data.keys())
-        max_temp = max(data.keys())
-        temp_range = max_temp - min_temp
-        for temperature in [min_temp, max_temp]:
-            pore_sizes = data[temperature]
-            sorted_pore_sizes = dict(sorted(pore_sizes.items()))
-            color = cmap((temperature - min_temp) / temp_range)
-            x = list(sorted_pore_sizes.keys())
-            y = [mean for mean, std in sorted_pore_sizes.values()]
-            yerr = [std for mean, std in sorted_pore_sizes.values()]
-            ax.plot(x, y, color=color)
-            ax.fill_between(x, [yi - err for yi, err in zip(y, yerr)], [yi + err for yi, err in zip(y, yerr)], color=color, alpha=0.3)
-        format_axes(ax, "Pore Size", r"Average Relative Energy ($\mathdefault{E_h Node^{-1}}$)", list(sorted_pore_sizes.keys()))
+        ax, pore_sizes = self._plot_per_temperature_lines(get_relative_energy, extremes_only=True)
+        format_axes(ax, "Pore Size", r"Average Relative Energy ($\mathdefault{E_h Node^{-1}}$)", pore_sizes[0], pore_sizes[-1])
         arrowed_spines(ax)
-        colour_bar_axes = plt.subplot(gs[1])
-        add_colourbar(colour_bar_axes, cmap, [min_temp, max_temp], " \n" + r"$\mathdefault{log_{10}(T_{thermal})}$")
 
     def plot_pearsons_vs_pore_size(self) -> None:
-        data = self.data_by_therm_pore(get_relative_pearsons)
-        data = {temperature: {pore: (np.mean(energies), np.std(energies)) for pore, energies in pore_sizes.items()}
-                for temperature, pore_sizes in data.items()}
-        cmap = cm.get_cmap("Wistia")
-        gs = gridspec.GridSpec(1, 2, width_ratios=[20, 1])
-        ax = plt.subplot(gs[0])
-        remove_axes(ax)
-        min_temp = min(data.keys())
-        temp_range = max(data.keys()) - min_temp
-        for temperature, pore_sizes in sorted(data.items()):
-            sorted_pore_sizes = dict(sorted(pore_sizes.items()))
-            color = cmap((temperature - min_temp) / temp_range)
-            x = list(sorted_pore_sizes.keys())
-            y = [mean for mean, std in sorted_pore_sizes.values()]
-            yerr = [std for mean, std in sorted_pore_sizes.values()]
-            ax.plot(x, y, color=color)
-            ax.fill_between(x, [yi - err for yi, err in zip(y, yerr)], [yi + err for yi, err in zip(y, yerr)], color=color, alpha=0.3)
+        ax, _ = self._plot_per_temperature_lines(get_relative_pearsons)
         format_axes(ax, "Pore Size", r"Average Pearson's Correlation Coefficient", 8, None, -0.35, -0.1)
         arrowed_spines(ax)
-        colour_bar_axes = plt.subplot(gs[1])
-        add_colourbar(colour_bar_axes, cmap, list(data.keys()), " \n" + r"$\mathdefault{log_{10}(T_{thermal})}$")
 
     def plot_energy_vs_distance(self) -> None:
-        data = [(entry.pore_distance, entry.energy / entry.num_nodes - RELATIVE_ENERGY,
-                 entry.changing_vars.get("Thermalising temperature"),
-                 entry.changing_vars.get("Annealing end temperature")) for entry in self.entries]
-
         # Extract pore distances, energies, and thermalising temperatures
-        pore_distances, energies, thermal_temps, _ = zip(*data)
+        columns = self.columns
+        pore_distances = columns["pore_distance"]
+        energies = get_relative_energy(columns)
+        thermal_temps = columns["thermal_temp"]
 
         # Calculate mean and standard deviation for each unique pore_distance
-        unique_distances = np.unique(pore_distances)
-        means = [np.mean([energies[i] for i in range(len(energies)) if pore_distances[i] == dist]) for dist in unique_distances]
-        std_devs = [np.std([energies[i] for i in range(len(energies)) if pore_distances[i] == dist]) for dist in unique_distances]
+        unique_distances, means, std_devs = group_mean_std(energies, pore_distances)
+        unique_distances = [distance for distance, in unique_distances]
 
-        cmap = cm.get_cmap("cool")
+        cmap = COOL
         gs = gridspec.GridSpec(1, 2, width_ratios=[20, 1])
         ax = plt.subplot(gs[0])
         remove_axes(ax)
         # Plot data
-        ax.scatter(pore_distances, energies, c=thermal_temps, cmap=cmap)
+        ax.scatter(pore_distances, energies, c=thermal_temps, cmap=cmap, rasterized=len(energies) > RASTERIZE_SCATTER_THRESHOLD)
         # Plot variance with fill_between
-        ax.fill_between(unique_distances, [mean - std_dev for mean, std_dev in zip(means, std_devs)], [mean + std_dev for mean, std_dev in zip(means, std_devs)], alpha=0.2)
+        ax.fill_between(unique_distances, means - std_devs, means + std_devs, alpha=0.2)
         format_axes(ax, r"Distance Between Pores ($\mathdefault{a_0}$)", r"Average Relative Energy ($\mathdefault{E_h Node^{-1}}$)")
         arrowed_spines(ax)
         colour_bar_axes = plt.subplot(gs[1])
-        add_colourbar(colour_bar_axes, cmap, thermal_temps, " \n" + r"$\mathdefault{log_{10}(T_{thermal})}$")
+        add_colourbar(colour_bar_axes, cmap, np.unique(thermal_temps).tolist(), " \n" + r"$\mathdefault{log_{10}(T_{thermal})}$")
 
     def plot_energy_vs_distance_2(self) -> None:
-        data = defaultdict(lambda: defaultdict(list))
-        for entry in self.entries:
-            data[entry.pore_size][entry.pore_distance].append(entry.energy / entry.num_nodes - RELATIVE_ENERGY)
+        columns = self.columns
+        energies = get_relative_energy(columns)
 
-        # Calculate mean and standard deviation for each unique pore_distance for each pore_size
-        average_data = {pore_size: {distance: (np.mean(energies), np.std(energies)) for distance, energies in distances.items()}
-                        for pore_size, distances in data.items()}
-
-        # sort data by distance
-        average_data = {pore_size: {distance: energy for distance, energy in sorted(distances.items(), key=lambda x: x[0])}
-                        for pore_size, distances in average_data.items()}
-
-        # Get a list of unique pore sizes
-        pore_sizes = sorted(set(average_data.keys()))
-        max_pore_size = max(pore_sizes)
-        min_pore_size = min(pore_sizes)
+        # Calculate mean and standard deviation for each unique pore_distance for each pore_size (sorted by distance)
+        pore_sizes, groups = split_by_first_key(*group_mean_std_columns(energies, columns["pore_size"], columns["pore_distance"]))
+        max_pore_size = pore_sizes[-1]
+        min_pore_size = pore_sizes[0]
 
         # Create a colormap
-        cmap = cm.get_cmap("cool")
+        cmap = COOL
 
         # Normalize the pore sizes to the range [0, 1] to map to the colormap
         norm = Normalize(vmin=min_pore_size, vmax=max_pore_size)
@@ -428,210 +617,163 @@ class ResultsData:
         ax = plt.subplot(gs[0])
         remove_axes(ax)
 
-        for pore_size, distances in average_data.items():
-            distances_keys, distances_values = zip(*distances.items())
-            means, std_devs = zip(*distances_values)
-            ax.plot(distances_keys, means, label=f"Pore Size {pore_size}", color=cmap(norm(pore_size)))
-            ax.fill_between(distances_keys, [mean - std_dev for mean, std_dev in zip(means, std_devs)], [mean + std_dev for mean, std_dev in zip(means, std_devs)], alpha=0.2, color=cmap(norm(pore_size)))
+        colors = cmap(norm(pore_sizes))
+        distances, means, std_devs = zip(*groups)
+        add_line_collection(ax, distances, means, colors)
+        add_band_collection(ax, distances, [mean - std_dev for mean, std_dev in zip(means, std_devs)],
+                            [mean + std_dev for mean, std_dev in zip(means, std_devs)], colors, alpha=0.2)
 
         format_axes(ax, r"Distance Between Pores ($\mathdefault{a_0}$)", r"Average Relative Energy ($\mathdefault{E_h Node^{-1}}$)")
         arrowed_spines(ax)
         colour_bar_axes = plt.subplot(gs[1])
-        add_colourbar(colour_bar_axes, cmap, pore_sizes, "Pore Size")
+        add_colourbar(colour_bar_axes, cmap, pore_sizes.tolist(), "Pore Size")
 
     def plot_energy_vs_concentration(self) -> None:
-        data = defaultdict(lambda: defaultdict(list))
-        for entry in self.entries:
-            data[entry.pore_size][entry.pore_concentration].append(entry.energy / entry.num_nodes - RELATIVE_ENERGY)
-        average_data = {pore_size: {concentration: np.mean(energies) for concentration, energies in concentrations.items()}
-                        for pore_size, concentrations in data.items()}
-        # sort data by concentration
-        average_data = {pore_size: {concentration: energy for concentration, energy in sorted(concentrations.items(), key=lambda x: x[0])}
-                        for pore_size, concentrations in average_data.items()}
-        # Get a list of unique pore sizes
-        pore_sizes = sorted(set(average_data.keys()))
-        cmap = cm.get_cmap("cool")
-        norm = Normalize(vmin=min(pore_sizes), vmax=max(pore_sizes))
+        columns = self.columns
+        relative_energies = get_relative_energy(columns)
+        pore_sizes, groups = split_by_first_key(*group_mean_std_columns(relative_energies, columns["pore_size"], columns["pore_concentration"]))
+        cmap = COOL
+        norm = Normalize(vmin=pore_sizes[0], vmax=pore_sizes[-1])
         gs = gridspec.GridSpec(1, 2, width_ratios=[20, 1])
         ax = plt.subplot(gs[0])
         remove_axes(ax)
-        for pore_size, concentrations in average_data.items():
-            ax.plot(concentrations.keys(), concentrations.values(), label=f"Pore Size {pore_size}", color=cmap(norm(pore_size)))
+        colors = cmap(norm(pore_sizes))
+        concentrations, means, _ = zip(*groups)
+        add_line_collection(ax, concentrations, means, colors)
         format_axes(ax, "Pore Fraction", r"Average Relative Energy ($\mathdefault{E_h Node^{-1}}$)")
         arrowed_spines(ax)
         colour_bar_axes = plt.subplot(gs[1])
-        add_colourbar(colour_bar_axes, cmap, pore_sizes, "Pore Size")
+        add_colourbar(colour_bar_axes, cmap, pore_sizes.tolist(), "Pore Size")
 
     def plot_energy_vs_concentration_2(self) -> None:
-        data = defaultdict(lambda: defaultdict(list))
-        for entry in self.entries:
-            data[entry.pore_size][entry.pore_concentration].append((entry.energy / entry.num_nodes - RELATIVE_ENERGY) / entry.pore_size)
-        average_data = {pore_size: {concentration: np.mean(energies) for concentration, energies in concentrations.items()}
-                        for pore_size, concentrations in data.items()}
-        # sort data by concentration
-        average_data = {pore_size: {concentration: energy for concentration, energy in sorted(concentrations.items(), key=lambda x: x[0])}
-                        for pore_size, concentrations in average_data.items()}
-        # Get a list of unique pore sizes
-        pore_sizes = sorted(set(average_data.keys()))
-        cmap = cm.get_cmap("cool")
-        norm = Normalize(vmin=min(pore_sizes), vmax=max(pore_sizes))
+        columns = self.columns
+        relative_energies = get_relative_energy(columns) / columns["pore_size"]
+        pore_sizes, groups = split_by_first_key(*group_mean_std_columns(relative_energies, columns["pore_size"], columns["pore_concentration"]))
+        cmap = COOL
+        norm = Normalize(vmin=pore_sizes[0], vmax=pore_sizes[-1])
         gs = gridspec.GridSpec(1, 2, width_ratios=[20, 1])
         ax = plt.subplot(gs[0])
         remove_axes(ax)
-        for pore_size, concentrations in average_data.items():
-            ax.plot(concentrations.keys(), concentrations.values(), label=f"Pore Size {pore_size}", color=cmap(norm(pore_size)))
+        colors = cmap(norm(pore_sizes))
+        concentrations, means, _ = zip(*groups)
+        add_line_collection(ax, concentrations, means, colors)
         format_axes(ax, "Pore Fraction", r"Average Relative Energy / Pore Size ($\mathdefault{E_h Node^{-1}}$)")
         arrowed_spines(ax)
         colour_bar_axes = plt.subplot(gs[1])
-        add_colourbar(colour_bar_axes, cmap, pore_sizes, "Pore Size")
+        add_colourbar(colour_bar_axes, cmap, pore_sizes.tolist(), "Pore Size")
 
     def plot_energy_vs_concentration_3(self) -> None:
-        data = defaultdict(lambda: defaultdict(list))
-        for entry in self.entries:
-            data[entry.pore_size][entry.pore_concentration].append((entry.energy / entry.num_nodes - RELATIVE_ENERGY) / entry.ring_area_estimate)
-
-        # Calculate mean and standard deviation for each unique pore_concentration for each pore_size
-        average_data = {pore_size: {concentration: (np.mean(energies), np.std(energies)) for concentration, energies in concentrations.items()}
-                        for pore_size, concentrations in data.items()}
+        columns = self.columns
+        relative_energies = get_relative_energy(columns) / columns["ring_area_estimate"]
 
-        # sort data by concentration
-        average_data = {pore_size: {concentration: energy for concentration, energy in sorted(concentrations.items(), key=lambda x: x[0])}
-                        for pore_size, concentrations in average_data.items()}
+        # Calculate mean and standard deviation for each unique pore_concentration for each pore_size (sorted by concentration)
+        pore_sizes, groups = split_by_first_key(*group_mean_std_columns(relative_energies, columns["pore_size"], columns["pore_concentration"]))
 
-        # Get a list of unique pore sizes
-        pore_sizes = sorted(set(average_data.keys()))
-
-        cmap = cm.get_cmap("cool")
-        norm = Normalize(vmin=min(pore_sizes), vmax=max(pore_sizes))
+        cmap = COOL
+        norm = Normalize(vmin=pore_sizes[0], vmax=pore_sizes[-1])
 
         gs = gridspec.GridSpec(1, 2, width_ratios=[20, 1])
         ax = plt.subplot(gs[0])
         remove_axes(ax)
 
-        for pore_size, concentrations in average_data.items():
-            concentrations_keys, concentrations_values = zip(*concentrations.items())
-            means, std_devs = zip(*concentrations_values)
-            ax.plot(concentrations_keys, means, label=f"Pore Size {pore_size}", color=cmap(norm(pore_size)))
+        colors = cmap(norm(pore_sizes))
+        concentrations, means, std_devs = zip(*groups)
+        add_line_collection(ax, concentrations, means, colors)
 
-            # Plot variance with fill_between
-            ax.fill_between(concentrations_keys, [mean - std_dev for mean, std_dev in zip(means, std_devs)], [mean + std_dev for mean, std_dev in zip(means, std_devs)], alpha=0.2, color=cmap(norm(pore_size)))
+        # Plot variance as shaded bands
+        add_band_collection(ax, concentrations, [mean - std_dev for mean, std_dev in zip(means, std_devs)],
+                            [mean + std_dev for mean, std_dev in zip(means, std_devs)], colors, alpha=0.2)
 
         format_axes(ax, "Pore Fraction", r"Avg Relative Energy / Pore Area Estimate ($\mathdefault{E_h Node^{-1} a_0^{-2}}$)")
         colour_bar_axes = plt.subplot(gs[1])
-        add_colourbar(colour_bar_axes, cmap, pore_sizes, "Pore Size")
+        add_colourbar(colour_bar_axes, cmap, pore_sizes.tolist(), "Pore Size")
 
     def plot_energy_vs_concentration_4(self) -> None:
-        data = defaultdict(lambda: defaultdict(list))
-        for entry in self.entries:
-            data[entry.pore_size][entry.pore_concentration].append((entry.energy / entry.num_nodes - RELATIVE_ENERGY) / entry.ring_area)
-        average_data = {pore_size: {concentration: np.mean(energies) for concentration, energies in concentrations.items()}
-                        for pore_size, concentrations in data.items()}
-        # sort data by concentration
-        average_data = {pore_size: {concentration: energy for concentration, energy in sorted(concentrations.items(), key=lambda x: x[0])}
-                        for pore_size, concentrations in average_data.items()}
-        # Get a list of unique pore sizes
-        pore_sizes = sorted(set(average_data.keys()))
-        cmap = cm.get_cmap("cool")
-        norm = Normalize(vmin=min(pore_sizes), vmax=max(pore_sizes))
+        columns = self.columns
+        relative_energies = get_relative_energy(columns) / columns["ring_area"]
+        pore_sizes, groups = split_by_first_key(*group_mean_std_columns(relative_energies, columns["pore_size"], columns["pore_concentration"]))
+        cmap = COOL
+        norm = Normalize(vmin=pore_sizes[0], vmax=pore_sizes[-1])
         gs = gridspec.GridSpec(1, 2, width_ratios=[20, 1])
         ax = plt.subplot(gs[0])
         remove_axes(ax)
-        for pore_size, concentrations in average_data.items():
-            ax.plot(concentrations.keys(), concentrations.values(), label=f"Pore Size {pore_size}", color=cmap(norm(pore_size)))
+        colors = cmap(norm(pore_sizes))
+        concentrations, means, _ = zip(*groups)
+        add_line_collection(ax, concentrations, means, colors)
 
         format_axes(ax, "Pore Fraction", r"Average Relative Energy / Pore Area ($\mathdefault{E_h Node^{-1} a_0^{-2}}$)")
         arrowed_spines(ax)
         colour_bar_axes = plt.subplot(gs[1])
-        add_colourbar(colour_bar_axes, cmap, pore_sizes, "Pore Size")
+        add_colourbar(colour_bar_axes, cmap, pore_sizes.tolist(), "Pore Size")
 
     def plot_entropy_vs_step(self) -> None:
-        data = defaultdict(list)
-        steps = self.entries[0].get_entropy_data()[0]
-        for entry in self.entries:
-            data[entry.changing_vars.get("Annealing steps")].append(entry.get_entropy_data()[1])
-        average_data = {annealing_temp: np.mean(energies) for annealing_temp, energies in data.items()}
-        cmap = cm.get_cmap("cool")
+        """
+        Plots the average relative entropy at each step, as one line per number of annealing steps coloured by it.
+        This used to average each group down to a single number and plot those against the steps, which only
+        worked when there were as many groups as steps
+        """
+        steps, entropies = self.get_entropy_matrix()
+        # Entries that do not vary the number of annealing steps (NaN) are skipped, as in group_by
+        anneal_steps = self.columns["anneal_steps"]
+        mask = ~np.isnan(anneal_steps)
+        if not mask.any():
+            print("No entries vary the number of annealing steps")
+            return
+        anneal_steps, labels = np.unique(anneal_steps[mask], return_inverse=True)
+        labels = labels.reshape(-1)
+        entropies = entropies[mask]
+        sums = np.zeros((len(anneal_steps), len(steps)), dtype=np.float64)
+        np.add.at(sums, labels, entropies)
+        average_entropies = sums / np.bincount(labels)[:, None]
+        cmap = COOL
         gs = gridspec.GridSpec(1, 2, width_ratios=[20, 1])
         ax = plt.subplot(gs[0])
         remove_axes(ax)
-        ax.plot(steps, average_data.values(), color=cmap(0))
-        format_axes(ax, "Annealing Steps", r"Average Relative Entropy (a.u)", steps)
+        ticks = anneal_steps.tolist()
+        norm = Normalize(vmin=ticks[0], vmax=ticks[-1])
+        colors = cmap(norm(anneal_steps))
+        add_line_collection(ax, [steps] * len(anneal_steps), average_entropies, colors)
+        format_axes(ax, "Annealing Steps", r"Average Relative Entropy (a.u)", steps[0], steps[-1])
         arrowed_spines(ax)
         colour_bar_axes = plt.subplot(gs[1])
-        add_colourbar(colour_bar_axes, cmap, [0], "Annealing Temperature")
+        add_colourbar(colour_bar_axes, cmap, ticks, "Annealing Steps")
 
-    def gen_bond_angles(self) -> Generator[float, None, None]:
-        for result_entry in self.entries:
-            for bond_angle in result_entry.get_bond_angles_fast():
-                yield bond_angle
+    def all_bond_angles(self) -> np.ndarray:
+        """
+        Gets the bond angles of every entry as a single array
+        """
+        if not self.entries:
+            return np.empty(0, dtype=np.float64)
+        return np.concatenate([np.asarray(entry.get_bond_angles_fast(), dtype=np.float64) for entry in self.entries])
 
     def plot_angle_distribution(self) -> None:
-        bond_angles = self.gen_bond_angles()
-        hist, bins = np.histogram([], bins=100, range=(0, 360))
-        for bond_angle in bond_angles:
-            hist += np.histogram([bond_angle], bins=bins)[0]
+        bond_angles = self.all_bond_angles()
+        # The bins are equal width, so each angle's bin is found directly, as np.histogram does with a range
+        # but without its edge and range checks. Angles of exactly 360 go in the last bin
+        bond_angles = bond_angles[(bond_angles >= 0) & (bond_angles <= 360)]
+        bin_indexes = np.minimum((bond_angles * (NUM_ANGLE_BINS / 360)).astype(np.intp), NUM_ANGLE_BINS - 1)
+        hist = np.bincount(bin_indexes, minlength=NUM_ANGLE_BINS)
+        bins = np.linspace(0, 360, NUM_ANGLE_BINS + 1)
         ax = plt.gca()
         ax.bar(bins[:-1], hist, width=np.diff(bins), align="edge")
         format_axes(ax, "Bond Angle (degrees)", "Frequency", 0, 360, 0, None, 30, None)
         arrowed_spines(ax)
 
     def plot_angle_variance_vs_pore_size(self) -> None:
-        data = self.data_by_therm_pore(get_angle_variance)
-        data = {temperature: {pore: (np.mean(energies), np.std(energies)) for pore, energies in pore_sizes.items()}
-                for temperature, pore_sizes in data.items()}
-        cmap = cm.get_cmap("Wistia")
-        gs = gridspec.GridSpec(1, 2, width_ratios=[20, 1])
-        ax = plt.subplot(gs[0])
-        remove_axes(ax)
-        min_temp = min(data.keys())
-        temp_range = max(data.keys()) - min_temp
-        max_pore_size = max(pore for pore_sizes in data.values() for pore in pore_sizes.keys())
-        for temperature, pore_sizes in sorted(data.items()):
-            sorted_pore_sizes = dict(sorted(pore_sizes.items()))
-            color = cmap((temperature - min_temp) / temp_range)
-            x = list(sorted_pore_sizes.keys())
-            y = [mean for mean, std in sorted_pore_sizes.values()]
-            yerr = [std for mean, std in sorted_pore_sizes.values()]
-            ax.plot(x, y, color=color)
-            ax.fill_between(x, [yi - err for yi, err in zip(y, yerr)], [yi + err for yi, err in zip(y, yerr)], color=color, alpha=0.3)
-        format_axes(ax, "Pore Size", r"Average Angle Variance (degrees$\mathdefault{^2}$)", 8, max_pore_size, 0, None)
+        ax, pore_sizes = self._plot_per_temperature_lines(get_angle_variance)
+        format_axes(ax, "Pore Size", r"Average Angle Variance (degrees$\mathdefault{^2}$)", 8, pore_sizes[-1], 0, None)
         arrowed_spines(ax)
-        colour_bar_axes = plt.subplot(gs[1])
-        add_colourbar(colour_bar_axes, cmap, list(data.keys()), " \n" + r"$\mathdefault{log_{10}(T_{thermal})}$")
 
     def get_pore_fraction_vs_acceptance_rate(self, smoothing: float = 1) -> tuple[np.ndarray, np.ndarray]:
-        data = defaultdict(list)
-        for entry in self.entries:
-            data[entry.pore_concentration].append(entry.acceptance_rate)
-        data = {concentration: np.mean(acceptance_rates) for concentration, acceptance_rates in data.items()}
-        # sort by concentration
-        data = dict(sorted(data.items(), key=lambda x: x[0]))
+        # Average the acceptance rates per concentration in one grouped reduction (sorted by concentration)
+        pore_concentrations, acceptance_rates, _ = self.mean_std_arrays(get_acceptance_rate, "pore_concentration")
         # Apply a moving average to the data
-        acceptance_rates = pd.Series(list(data.values())).rolling(window=smoothing, min_periods=1).mean().tolist()
-        return np.array(list(data.keys())), np.array(acceptance_rates)
+        return pore_concentrations, rolling_mean(acceptance_rates, int(smoothing))
 
     def plot_bond_length_variance_vs_pore_size(self) -> None:
-        data = self.data_by_therm_pore(get_bond_length_variance)
-        data = {temperature: {pore: (np.mean(variances), np.std(variances)) for pore, variances in pore_sizes.items()}
-                for temperature, pore_sizes in data.items()}
-        cmap = cm.get_cmap("Wistia")
-        gs = gridspec.GridSpec(1, 2, width_ratios=[20, 1])
-        ax = plt.subplot(gs[0])
-        remove_axes(ax)
-        min_temp = min(data.keys())
-        temp_range = max(data.keys()) - min_temp
-        for temperature, pore_sizes in sorted(data.items()):
-            sorted_pore_sizes = dict(sorted(pore_sizes.items()))
-            color = cmap((temperature - min_temp) / temp_range)
-            x = list(sorted_pore_sizes.keys())
-            y = [mean for mean, std in sorted_pore_sizes.values()]
-            yerr = [std for mean, std in sorted_pore_sizes.values()]
-            ax.plot(x, y, color=color)
-            ax.fill_between(x, [yi - err for yi, err in zip(y, yerr)], [yi + err for yi, err in zip(y, yerr)], color=color, alpha=0.3)
+        ax, _ = self._plot_per_temperature_lines(get_bond_length_variance)
         format_axes(ax, "Pore Size", r"Average Bond Length Variance ($\mathdefault{a_0^2}$)", 8, None, 0, None)
         arrowed_spines(ax)
-        colour_bar_axes = plt.subplot(gs[1])
-        add_colourbar(colour_bar_axes, cmap, list(data.keys()), " \n" + r"$\mathdefault{log_{10}(T_{thermal})}$")
 
     def plot_acceptance_rate_vs_pore_fraction(self) -> None:
         pore_fractions, acceptance_rates = self.get_pore_fraction_vs_acceptance_rate()
@@ -640,26 +782,9 @@ class ResultsData:
 
     def plot_bond_length_variance_vs_pore_concentration_with_acceptance_rate(self) -> None:
         # Get the bond length variance data
-        data = self.data_by_therm_pore_fraction(get_bond_length_variance)
-        data = {temperature: {fraction: (np.mean(variances), np.std(variances)) for fraction, variances in fractions.items()}
-                for temperature, fractions in data.items()}
-
-        cmap = cm.get_cmap("Wistia")
-        gs = gridspec.GridSpec(1, 2, width_ratios=[20, 1])
-        ax = plt.subplot(gs[0])
-
-        remove_axes(ax, spines=["top"])
-        min_temp = min(data.keys())
-        temp_range = max(data.keys()) - min_temp
-
-        for temperature, fractions in sorted(data.items()):
-            sorted_fractions = dict(sorted(fractions.items()))
-            color = cmap((temperature - min_temp) / temp_range)
-            x = list(sorted_fractions.keys())
-            y = [mean for mean, std in sorted_fractions.values()]
-            yerr = [std for mean, std in sorted_fractions.values()]
-            ax.plot(x, y, color=color)
-            ax.fill_between(x, [yi - err for yi, err in zip(y, yerr)], [yi + err for yi, err in zip(y, yerr)], color=color, alpha=0.3)
+        ax, _ = self._plot_per_temperature_lines(get_bond_length_variance, x_column="pore_concentration")
+        # Keep the right spine as the acceptance rate axis
+        ax.spines["right"].set_visible(True)
 
         # Get the acceptance rate data
         pore_fractions, acceptance_rates = self.get_pore_fraction_vs_acceptance_rate(smoothing=5)
@@ -676,56 +801,15 @@ class ResultsData:
         ax2.set_xlim(0, max(pore_fractions))
         format_axes(ax, "Pore Fraction", r"Average Bond Length Variance ($\mathdefault{a_0^2}$)", 0, max(pore_fractions), 0, None)
 
-        colour_bar_axes = plt.subplot(gs[1])
-        add_colourbar(colour_bar_axes, cmap, list(data.keys()), " \n" + r"$\mathdefault{log_{10}(T_{thermal})}$")
-
     def plot_bond_length_variance_vs_pore_concentration(self) -> None:
-        data = defaultdict(lambda: defaultdict(list))
         # use the colour bar for thermalisation temperature
-        data = self.data_by_therm_pore_fraction(get_bond_length_variance)
-        data = {temperature: {concentration: (np.mean(variances), np.std(variances)) for concentration, variances in concentrations.items()}
-                for temperature, concentrations in data.items()}
-        cmap = cm.get_cmap("Wistia")
-        gs = gridspec.GridSpec(1, 2, width_ratios=[20, 1])
-        ax = plt.subplot(gs[0])
-        remove_axes(ax)
-        min_temp = min(data.keys())
-        temp_range = max(data.keys()) - min_temp
-        for temperature, concentrations in sorted(data.items()):
-            sorted_concentrations = dict(sorted(concentrations.items()))
-            color = cmap((temperature - min_temp) / temp_range)
-            x = list(sorted_concentrations.keys())
-            y = [mean for mean, std in sorted_concentrations.values()]
-            yerr = [std for mean, std in sorted_concentrations.values()]
-            ax.plot(x, y, color=color)
-            ax.fill_between(x, [yi - err for yi, err in zip(y, yerr)], [yi + err for yi, err in zip(y, yerr)], color=color, alpha=0.3)
+        ax, _ = self._plot_per_temperature_lines(get_bond_length_variance, x_column="pore_concentration")
         format_axes(ax, "Pore Fraction", r"Average Bond Length Variance ($\mathdefault{a_0^2}$)", 0, None, 0, None)
-        colour_bar_axes = plt.subplot(gs[1])
-        add_colourbar(colour_bar_axes, cmap, list(data.keys()), " \n" + r"$\mathdefault{log_{10}(T_{thermal})}$")
 
     def plot_angle_variance_vs_pore_concentration(self) -> None:
-        data = defaultdict(lambda: defaultdict(list))
         # use the colour bar for thermalisation temperature
-        data = self.data_by_therm_pore_fraction(get_angle_variance)
-        data = {temperature: {concentration: (np.mean(variances), np.std(variances)) for concentration, variances in concentrations.items()}
-                for temperature, concentrations in data.items()}
-        cmap = cm.get_cmap("Wistia")
-        gs = gridspec.GridSpec(1, 2, width_ratios=[20, 1])
-        ax = plt.subplot(gs[0])
-        remove_axes(ax)
-        min_temp = min(data.keys())
-        temp_range = max(data.keys()) - min_temp
-        for temperature, concentrations in sorted(data.items()):
-            sorted_concentrations = dict(sorted(concentrations.items()))
-            color = cmap((temperature - min_temp) / temp_range)
-            x = list(sorted_concentrations.keys())
-            y = [mean for mean, std in sorted_concentrations.values()]
-            yerr = [std for mean, std in sorted_concentrations.values()]
-            ax.plot(x, y, color=color)
-            ax.fill_between(x, [yi - err for yi, err in zip(y, yerr)], [yi + err for yi, err in zip(y, yerr)], color=color, alpha=0.3)
+        ax, _ = self._plot_per_temperature_lines(get_angle_variance, x_column="pore_concentration")
         format_axes(ax, "Pore Fraction", r"Average Angle  Variance ($\mathdefault{degrees^2}$)", 0, None, 0, None)
-        colour_bar_axes = plt.subplot(gs[1])
-        add_colourbar(colour_bar_axes, cmap, list(data.keys()), " \n" + r"$\mathdefault{log_{10}(T_{thermal})}$")
 
     @ property
     def num_entries(self) -> int:
@@ -1,7 +1,12 @@
+import atexit
 import shutil
-import stat
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import Generator, Optional
 
 import paramiko
 
@@ -11,6 +16,27 @@ class LogInException(Exception):
 
 
 MIN_FREE_SPACE = 10 * 1024 * 1024 * 1024  # 10 GB
+DOWNLOAD_WORKERS = 4  # Number of batch runs downloaded from the host at once
+# Prints the absolute path of each batch's completion_flag files in BSS-Batch-Manager-Remote
+FIND_COMPLETION_FLAGS_COMMAND = ('bmr="$(readlink -f ~/BSS-Batch-Manager-Remote)" && [ -d "$bmr" ] && '
+                                 'find "$bmr" -mindepth 2 -maxdepth 2 -type f -name "*completion_flag" ! -path "$bmr/remote_management/*"')
+# Deletes the empty batch folders directly inside BSS-Batch-Manager-Remote, never anything below them
+DELETE_EMPTY_BATCH_DIRS_COMMAND = ('bmr="$(readlink -f ~/BSS-Batch-Manager-Remote)" && [ -d "$bmr" ] && '
+                                   'find "$bmr" -mindepth 1 -maxdepth 1 -type d -empty ! -name remote_management -delete')
+SFTP_WINDOW_SIZE = 2 ** 27  # Bytes the host can send on a download channel before waiting for acknowledgement (128 MiB)
+
+# Logged in clients by (hostname, username), reused until their connection drops or they are closed
+_ssh_clients: dict[tuple[str, str], paramiko.SSHClient] = {}
+
+
+@atexit.register
+def close_ssh_clients() -> None:
+    """
+    Closes every cached SSH client
+    """
+    for client in _ssh_clients.values():
+        client.close()
+    _ssh_clients.clear()
 
 
 def command_print(ssh: paramiko.SSHClient, command: list) -> None:
@@ -51,8 +77,8 @@ def command_lines(ssh: paramiko.SSHClient, command: str) -> list[str]:
         _, stdout, _ = ssh.exec_command(command)
     except paramiko.SSHException:
         raise paramiko.SSHException(f"Error running command: {command}")
-    lines = stdout.read().decode("ascii").split("\n")[:-1]
-    return lines
+    # Read the output a line at a time rather than decoding and splitting one copy of all of it
+    return [line.rstrip("\r\n") for line in stdout]
 
 
 def create_ssh_client(username: str, hostname: str, port: int = 22) -> paramiko.SSHClient:
@@ -75,7 +101,9 @@ def create_ssh_client(username: str, hostname: str, port: int = 22) -> paramiko.
 
 def ssh_login_silent(username: str, hostname: str) -> paramiko.SSHClient:
     """
-    Logs into a remote server using SSH on port 22
+    Logs into a remote server using SSH on port 22, reusing the client from a previous login
+    if its connection is still active. The client is shared with every other caller, so callers
+    must not close it themselves; cached clients are closed at exit by close_ssh_clients
 
     Args:
         username (str): The username to login with
@@ -85,10 +113,17 @@ def ssh_login_silent(username: str, hostname: str) -> paramiko.SSHClient:
     Raises:
         LogInException: If the login fails
     """
+    client = _ssh_clients.get((hostname, username))
+    if client is not None:
+        transport = client.get_transport()
+        if transport is not None and transport.is_active():
+            return client
     try:
-        return create_ssh_client(username, hostname)
+        client = create_ssh_client(username, hostname)
     except (paramiko.AuthenticationException, paramiko.SSHException):
         raise LogInException(f"Failed to login to {hostname} as {username} on port 22")
+    _ssh_clients[(hostname, username)] = client
+    return client
 
 
 def sftp_exists(sftp: paramiko.SFTPClient, path: Path) -> bool:
@@ -120,27 +155,143 @@ def land_directory(sftp: paramiko.SFTPClient, remote_path: Path) -> None:
     Returns:
         None
     """
-    if remote_path == "/":
-        sftp.chdir("/")
-        return
-    if remote_path == "":
-        return
     try:
+        # Most directories already exist, so try landing in one round trip first
         sftp.chdir(remote_path.as_posix())
+        return
     except IOError:
-        dirname = remote_path.parent
-        basename = remote_path.name
-        land_directory(sftp, dirname)
+        pass
+    # Walk up to the deepest existing ancestor, then make each missing directory below it
+    missing_paths = [remote_path]
+    for parent in remote_path.parents:
         try:
-            sftp.mkdir(basename)
-            sftp.chdir(basename)
+            sftp.chdir(parent.as_posix())
+            break
+        except IOError:
+            missing_paths.append(parent)
+    for missing_path in reversed(missing_paths):
+        try:
+            sftp.mkdir(missing_path.name)
+            sftp.chdir(missing_path.name)
         except IOError:
             raise IOError(f"Could not make remote directory {remote_path}, check permissions")
 
 
+@dataclass
+class BatchDownload:
+    batch_name: str
+    run_number: int
+    zip_path: Path
+    flag_path: Path
+
+
+def find_batch_downloads(ssh: paramiko.SSHClient) -> Generator[BatchDownload, None, None]:
+    """
+    Finds the completed batch runs on the host. The host walks BSS-Batch-Manager-Remote itself,
+    so this takes a single round trip
+
+    Args:
+        ssh (paramiko.SSHClient): The SSH client
+    Yields:
+        BatchDownload: The zip and completion_flag paths of each completed run
+    """
+    for line in command_lines(ssh, FIND_COMPLETION_FLAGS_COMMAND):
+        flag_path = Path(line)
+        sub_file = flag_path.name
+        print(f"Identified completion_flag file: {sub_file}")
+        try:
+            run_number = int(sub_file.split('_')[-3])
+        except ValueError:
+            print(f"ValueError while extracting integer from {sub_file}")
+            return
+        batch_name = '_'.join(sub_file.split('_')[:-4])
+        yield BatchDownload(batch_name, run_number, flag_path.parent.joinpath(f"{batch_name}_run_{run_number}.zip"), flag_path)
+
+
+def delete_empty_batch_dirs(ssh: paramiko.SSHClient) -> None:
+    """
+    Deletes the empty batch folders in BSS-Batch-Manager-Remote on the host, printing any errors it reports
+
+    Args:
+        ssh (paramiko.SSHClient): The SSH client
+    Raises:
+        paramiko.SSHException: If the command fails to run
+    """
+    command_print(ssh, DELETE_EMPTY_BATCH_DIRS_COMMAND)
+
+
+@dataclass
+class ThreadSFTPClients:
+    """
+    Opens one sftp channel per thread on an SSH client so that threads never share a channel,
+    keeping track of every channel opened so they can all be closed once the threads are done
+    """
+    ssh: paramiko.SSHClient
+    _thread_local: threading.local = field(default_factory=threading.local, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _clients: list[paramiko.SFTPClient] = field(default_factory=list, init=False, repr=False)
+
+    def get(self) -> paramiko.SFTPClient:
+        """
+        Gets the calling thread's sftp connection, opening a new channel on first use
+
+        Returns:
+            paramiko.SFTPClient: The calling thread's sftp connection
+        """
+        if not hasattr(self._thread_local, "sftp"):
+            # A large window keeps the link full on high latency connections, the default stalls every few hundred KB
+            self._thread_local.sftp = paramiko.SFTPClient.from_transport(self.ssh.get_transport(), window_size=SFTP_WINDOW_SIZE)
+            with self._lock:
+                self._clients.append(self._thread_local.sftp)
+        return self._thread_local.sftp
+
+    def close(self) -> None:
+        """
+        Closes every sftp connection opened, leaving the SSH client open
+        """
+        with self._lock:
+            for client in self._clients:
+                client.close()
+            self._clients.clear()
+
+
+def download_batch(sftp_clients: ThreadSFTPClients, batch_download: BatchDownload,
+                   output_path: Path, secondary_output_path: Optional[Path] = None) -> None:
+    """
+    Extracts a completed batch run straight from its zip on the host, without saving the zip locally,
+    then deletes its zip and completion_flag files from the host
+
+    Args:
+        sftp_clients (ThreadSFTPClients): The sftp connection of each download thread
+        batch_download (BatchDownload): The run to download
+        output_path (Path): the path to download and extract batches to
+        secondary_output_path (Path, optional): the path to use instead if output_path is low on disk space
+    """
+    sftp = sftp_clients.get()
+    batch_name, run_number = batch_download.batch_name, batch_download.run_number
+    # Check available disk space
+    total, used, free = shutil.disk_usage(output_path)
+    if free < MIN_FREE_SPACE and secondary_output_path is not None:
+        print("Switching to secondary output path due to low disk space")
+        extract_path = secondary_output_path.joinpath(batch_name, f"run_{run_number}")
+    else:
+        extract_path = output_path.joinpath(batch_name, f"run_{run_number}")
+    extract_path.mkdir(parents=True, exist_ok=True)
+    print("Downloading and extracting batch...")
+    with sftp.open(batch_download.zip_path.as_posix(), "rb") as remote_zip:
+        # Request the whole file in the background so reads don't each wait for a round trip
+        remote_zip.prefetch()
+        with zipfile.ZipFile(remote_zip) as archive:
+            archive.extractall(extract_path)
+    print("Deleting zip and completion_flag files")
+    sftp.remove(batch_download.zip_path.as_posix())
+    sftp.remove(batch_download.flag_path.as_posix())
+
+
 def receive_batches(username: str, hostname: str, output_path: Path, secondary_output_path: Optional[Path] = None) -> None:
     """
-    Receives batches from the host, deleting batch files and empty batch folders along the way
+    Receives batches from the host, deleting batch files and empty batch folders along the way.
+    Up to DOWNLOAD_WORKERS runs are downloaded and extracted at once, each over its own sftp channel
 
     Args:
         username (str): username to log in to host
@@ -149,49 +300,17 @@ def receive_batches(username: str, hostname: str, output_path: Path, secondary_o
         secondary_output_path (Path, optional): the secondary path to download and extract batches to
     """
     ssh = ssh_login_silent(username, hostname)
-    sftp = ssh.open_sftp()
-    bmr_path = Path(command_lines(ssh, "readlink -f ~/")[0]).joinpath("BSS-Batch-Manager-Remote")
-    none_found = True
-    for name in sftp.listdir(bmr_path.as_posix()):
-        if name == "remote_management":
-            continue
-        full_path = bmr_path.joinpath(name)
-        if not stat.S_ISDIR(sftp.stat(full_path.as_posix()).st_mode):
-            continue
-        sub_files = sftp.listdir(full_path.as_posix())
-        if not sub_files:
-            sftp.rmdir(full_path.as_posix())
-            continue
-        for sub_file in sub_files:
-            if not sub_file.endswith("completion_flag"):
-                continue
-            print(f"Identified completion_flag file: {sub_file}")
-            none_found = False
-            try:
-                run_number = int(sub_file.split('_')[-3])
-            except TypeError:
-                print(f"TypeError while extracting integer from {sub_file}")
-                return
-            batch_name = '_'.join(sub_file.split('_')[:-4])
-            zip_path = full_path.joinpath(f"{batch_name}_run_{run_number}.zip")
-
-            # Check available disk space
-            total, used, free = shutil.disk_usage(output_path)
-            if free < MIN_FREE_SPACE and secondary_output_path is not None:
-                print("Switching to secondary output path due to low disk space")
-                save_path = secondary_output_path.joinpath(batch_name, f"{batch_name}_run_{run_number}.zip")
-            else:
-                save_path = output_path.joinpath(batch_name, f"{batch_name}_run_{run_number}.zip")
-            save_path.parent.mkdir(parents=True, exist_ok=True)
-            print("Downloading batch...")
-            sftp.get(zip_path.as_posix(), save_path.as_posix())
-            print("Deleting zip and completion_flag files")
-            sftp.remove(zip_path.as_posix())
-            sftp.remove(full_path.joinpath(sub_file).as_posix())
-            extract_path = save_path.parent.joinpath(f"run_{run_number}")
-            extract_path.mkdir(parents=True, exist_ok=True)
-            print("Extracting batch...")
-            shutil.unpack_archive(filename=save_path, extract_dir=extract_path)
-            save_path.unlink()
-    if none_found:
+    batch_downloads = list(find_batch_downloads(ssh))
+    delete_empty_batch_dirs(ssh)
+    if not batch_downloads:
         print("No batches to receive\n")
+        return
+    # The SSH client stays cached, so its sftp channels must be closed here or they pile up on the host across calls
+    sftp_clients = ThreadSFTPClients(ssh)
+    try:
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+            # Consume the results so any download error is raised here
+            list(executor.map(partial(download_batch, sftp_clients, output_path=output_path,
+                                      secondary_output_path=secondary_output_path), batch_downloads))
+    finally:
+        sftp_clients.close()
@@ -0,0 +1,104 @@
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _ring_size_variances_numba(proportions: np.ndarray) -> np.ndarray:
+    num_steps, num_sizes = proportions.shape
+    variances = np.empty(num_steps, dtype=np.float64)
+    for step in prange(num_steps):
+        total = 0.0
+        first_moment = 0.0
+        second_moment = 0.0
+        for ring_size in range(num_sizes):
+            proportion = proportions[step, ring_size]
+            total += proportion
+            first_moment += ring_size * proportion
+            second_moment += ring_size * ring_size * proportion
+        variances[step] = second_moment - first_moment * first_moment / total
+    return variances
+
+
+def _ring_size_variances_numpy(proportions: np.ndarray) -> np.ndarray:
+    ring_sizes = np.arange(proportions.shape[1], dtype=np.float64)
+    total = proportions.sum(axis=1)
+    first_moment = proportions @ ring_sizes
+    second_moment = proportions @ (ring_sizes * ring_sizes)
+    return second_moment - first_moment * first_moment / total
+
+
+def _grouped_mean_std_numba(order: np.ndarray, offsets: np.ndarray, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    num_groups = len(offsets) - 1
+    means = np.empty(num_groups, dtype=np.float64)
+    stds = np.empty(num_groups, dtype=np.float64)
+    # Each group's rows are contiguous in order, so groups can be reduced independently without races
+    for group in prange(num_groups):
+        count = 0
+        mean = 0.0
+        sum_squared_deviations = 0.0
+        for i in range(offsets[group], offsets[group + 1]):
+            value = values[order[i]]
+            count += 1
+            delta = value - mean
+            mean += delta / count
+            sum_squared_deviations += delta * (value - mean)
+        means[group] = mean if count > 0 else np.nan
+        stds[group] = np.sqrt(sum_squared_deviations / count) if count > 0 else np.nan
+    return means, stds
+
+
+def _grouped_mean_std_numpy(order: np.ndarray, offsets: np.ndarray, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    num_groups = len(offsets) - 1
+    labels = np.empty(len(order), dtype=np.int64)
+    labels[order] = np.repeat(np.arange(num_groups), np.diff(offsets))
+    counts = np.diff(offsets)
+    means = np.bincount(labels, weights=values, minlength=num_groups) / counts
+    # Sum squared deviations from the means in a second pass, as E[x^2] - E[x]^2 cancels badly for values far from zero
+    deviations = values - means[labels]
+    return means, np.sqrt(np.bincount(labels, weights=deviations * deviations, minlength=num_groups) / counts)
+
+
+if NUMBA_AVAILABLE:
+    _ring_size_variances = njit(cache=True, parallel=True)(_ring_size_variances_numba)
+    _grouped_mean_std = njit(cache=True, parallel=True)(_grouped_mean_std_numba)
+else:
+    _ring_size_variances = _ring_size_variances_numpy
+    _grouped_mean_std = _grouped_mean_std_numpy
+
+
+def ring_size_variances(proportions: np.ndarray) -> np.ndarray:
+    """
+    Calculates the weighted ring size variance of every step in a single pass over the proportions,
+    using Numba to parallelise over steps if it is installed
+
+    Args:
+        proportions: a (num_steps, max_ring_size + 1) array where each row holds the proportion of each ring size
+
+    Returns:
+        a 1D array of the ring size variance of each step
+    """
+    return _ring_size_variances(np.ascontiguousarray(proportions, dtype=np.float64))
+
+
+def grouped_mean_std(labels: np.ndarray, values: np.ndarray, num_groups: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculates the mean and (population) standard deviation of values in each group, using Numba
+    to reduce groups in parallel (with Welford's algorithm) if it is installed
+
+    Args:
+        labels: the group index of each value, in the range [0, num_groups)
+        values: the values to reduce
+        num_groups: the number of groups
+
+    Returns:
+        1D arrays of the mean and standard deviation of each group
+    """
+    labels = np.asarray(labels, dtype=np.int64)
+    order = np.argsort(labels, kind="stable")
+    offsets = np.zeros(num_groups + 1, dtype=np.int64)
+    np.cumsum(np.bincount(labels, minlength=num_groups), out=offsets[1:])
+    return _grouped_mean_std(order, offsets, np.ascontiguousarray(values, dtype=np.float64))
@@ -1,11 +1,56 @@
-from typing import Tuple, Optional
+from functools import lru_cache
+from typing import Iterable, Iterator, Tuple, Optional
+import re
 import sys
 
+DEFAULT_CONFIRMATIONS: dict[str, bool] = {"y": True, "n": False}  # Whether each of confirm's default answers confirms
+
+
+def read_answer(prompt: str, source: Optional[Iterator[str]] = None) -> str:
+    """
+    Reads an answer from the user, or from the next line of a source of answers if one is given.
+    The source is an iterator so that each call carries on from the previous answer
+
+    Args:
+        prompt (str): The prompt to display
+        source (Iterator[str]): The lines to read answers from instead of standard input
+
+    Returns:
+        str: The answer, without a trailing newline
+
+    Raises:
+        EOFError: If the source has no more lines
+    """
+    if source is None:
+        return input(prompt)
+    print(prompt, end="")
+    try:
+        return next(source).rstrip("\r\n")
+    except StopIteration:
+        raise EOFError("Ran out of answers") from None
+
+
+@lru_cache(maxsize=32)
+def compile_char_class(chars: tuple[str, ...], negate: bool = False) -> re.Pattern:
+    """
+    Compiles a pattern matching any one of the given characters, reusing the pattern for repeated calls
+
+    Args:
+        chars (tuple[str, ...]): The characters to match
+        negate (bool): Whether to match any character except the given ones instead
+
+    Returns:
+        re.Pattern: The compiled pattern
+    """
+    return re.compile(f"[{'^' if negate else ''}{re.escape(''.join(chars))}]")
+
 
 def get_valid_int(prompt: str,
                   lower: float | int = float("-inf"),
                   upper: float | int = float("inf"),
-                  exit_string: Optional[str] = None) -> int | None:
+                  exit_string: Optional[str] = None,
+                  verbose: bool = True,
+                  source: Optional[Iterable[str]] = None) -> int | None:
     """
     Obtains a valid integer from the user within a given range
 
@@ -14,21 +59,26 @@ def get_valid_int(prompt: str,
         lower (float | int): The lower bound of the range
         upper (float | int): The upper bound of the range
         exit_string (str): The string to enter to exit the prompt
+        verbose (bool): Whether to print error messages
+        source (Iterable[str]): The lines to read answers from instead of standard input, eg a list or an open file
 
     Returns:
         int | None: The valid integer entered by the user, or None if the user entered the exit string
     """
+    lines = None if source is None else iter(source)
     while True:
-        answer = input(prompt)
+        answer = read_answer(prompt, lines)
         if answer == exit_string:
             return None
         try:
             answer = int(answer)
         except ValueError:
-            print("Answer is not a valid integer")
+            if verbose:
+                print("Answer is not a valid integer")
             continue
         if answer < lower or answer > upper:
-            print(f"Answer is out of bounds, must be between {lower} and {upper} inclusive")
+            if verbose:
+                print(f"Answer is out of bounds, must be between {lower} and {upper} inclusive")
             continue
         return answer
 
@@ -38,7 +88,8 @@ def get_valid_str(prompt: str,
                   forbidden_chars: Optional[list[str]] = None,
                   lower: int = 0,
                   upper: int = sys.maxsize,
-                  verbose: bool = True) -> str:
+                  verbose: bool = True,
+                  source: Optional[Iterable[str]] = None) -> str:
     """
     Gets a valid string from the user
 
@@ -49,21 +100,26 @@ def get_valid_str(prompt: str,
         lower (int): The minimum length of the string
         upper (int): The maximum length of the string
         verbose (bool): Whether to print error messages
+        source (Iterable[str]): The lines to read answers from instead of standard input, eg a list or an open file
 
     Returns:
         str: The valid string entered by the user
     """
+    # Each check is a single scan that stops at the first offending character
+    disallowed_pattern = compile_char_class(tuple(allowed_chars), negate=True) if allowed_chars else None
+    forbidden_pattern = compile_char_class(tuple(forbidden_chars)) if forbidden_chars else None
+    lines = None if source is None else iter(source)
     while True:
-        string = input(prompt)
+        string = read_answer(prompt, lines)
         if len(string) < lower or len(string) > upper:
             if verbose:
                 print(f"Input must be between {lower} and {upper} characters long")
             continue
-        if allowed_chars and not set(string).issubset(allowed_chars):
+        if disallowed_pattern is not None and disallowed_pattern.search(string):
             if verbose:
                 print(f"Input must only contain {allowed_chars}")
             continue
-        if forbidden_chars and set(string).intersection(forbidden_chars):
+        if forbidden_pattern is not None and forbidden_pattern.search(string):
             if verbose:
                 print(f"Input must not contain {forbidden_chars}")
             continue
@@ -71,13 +127,17 @@ def get_valid_str(prompt: str,
 
 
 def confirm(prompt: str = "Are you sure? [y,n]\n",
-            answers: Tuple[str, str] = ("y", "n")) -> bool:
+            answers: Tuple[str, str] = ("y", "n"),
+            verbose: bool = True,
+            source: Optional[Iterable[str]] = None) -> bool:
     """
     Asks the user for confirmation
 
     Args:
         prompt (str): The prompt to display to the user
         answers (Tuple[str, str]): The two valid answers
+        verbose (bool): Whether to print error messages
+        source (Iterable[str]): The lines to read answers from instead of standard input, eg a list or an open file
 
     Returns:
         bool: True if the user confirms, False otherwise
@@ -87,10 +147,11 @@ def confirm(prompt: str = "Are you sure? [y,n]\n",
     """
     if len(answers) != 2:
         raise ValueError("There must be exactly two answers")
+    confirmations = DEFAULT_CONFIRMATIONS if answers == ("y", "n") else {answers[0]: True, answers[1]: False}
+    lines = None if source is None else iter(source)
     while True:
-        conf = input(prompt).lower()
-        if conf == answers[0]:
-            return True
-        elif conf == answers[1]:
-            return False
-        print("That is not a valid answer")
+        confirmation = confirmations.get(read_answer(prompt, lines).strip().lower())
+        if confirmation is not None:
+            return confirmation
+        if verbose:
+            print("That is not a valid answer")
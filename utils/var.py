@@ -1,27 +1,50 @@
 from __future__ import annotations
 
+import operator
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from typing import Any, Optional, Type
 
 from .custom_types import BondSelectionProcess, StructureType
 from .validation_utils import get_valid_int
-from .variation_modes import VariationMode
+from .variation_modes import TooManyAttemptsError, VariationMode
 from .custom_types import BSSType
 
 
-@dataclass
+@lru_cache(maxsize=None)
+def get_vary_prompt(variation_modes: tuple[VariationMode, ...]) -> str:
+    """
+    Gets the prompt asking how to vary a variable with the given variation modes, built once per set of modes
+
+    Args:
+        variation_modes: the variation modes to list, in order
+    Returns:
+        the prompt, with a final option to cancel
+    """
+    options = [f"{i}) {mode.value}\n" for i, mode in enumerate(variation_modes, start=1)]
+    return "".join(["How would you like to vary this variable?\n", *options, f"{len(variation_modes) + 1}) Cancel\n"])
+
+
+@dataclass(slots=True)
 class Var(ABC):
     name: str
     value: Optional[BSSType] = None
     is_table_relevant: bool = True
     variation_modes: list[VariationMode] = field(default_factory=list)
     expected_type: Type[Any] = None
+    short_name: str = field(init=False, repr=False)
+    _hash: int = field(init=False, repr=False)
 
+    # Subclasses call Var.__post_init__ explicitly, as zero argument super() doesn't work in slotted dataclasses
     def __post_init__(self):
         if self.value is not None and not isinstance(self.value, (int, float, str, bool, StructureType, BondSelectionProcess)):
             raise ValueError(f"Invalid type for variable {self.name}: {type(self.value)}")
-        self.short_name = "_".join([word[:4] for word in self.name.split()])
+        # Vars of the same name share one string, so comparing their names usually stops at an identity check
+        self.name = sys.intern(self.name)
+        self.short_name = "_".join(word[:4] for word in self.name.split())
+        self._hash = hash(self.name)
 
     @abstractmethod
     def set_value(self, value: BSSType) -> None:
@@ -32,29 +55,45 @@ class Var(ABC):
         pass
 
     def get_vary_array(self) -> list[BSSType] | None:
-        prompt: str = "How would you like to vary this variable?\n"
-        for i, mode in enumerate(self.variation_modes, start=1):
-            prompt += f"{i}) {mode.value}\n"
         exit_num = len(self.variation_modes) + 1
-        prompt += f"{exit_num}) Cancel\n"
-        selection = get_valid_int(prompt, 1, exit_num)
-        if selection == exit_num:
-            return None
-        return self.variation_modes[selection - 1].get_vary_array(self.lower, self.upper, self.round_nums)
+        # Only numeric vars have bounds, the other variation modes ignore them
+        lower = getattr(self, "lower", float("-inf"))
+        upper = getattr(self, "upper", float("inf"))
+        round_nums = getattr(self, "round_nums", False)
+        while True:
+            selection = get_valid_int(get_vary_prompt(tuple(self.variation_modes)), 1, exit_num)
+            if selection == exit_num:
+                return None
+            try:
+                return self.variation_modes[selection - 1].get_vary_array(lower, upper, round_nums)
+            except TooManyAttemptsError as e:
+                # Only give up on this variable, going back to the choice of variation mode
+                print(e)
 
     def __eq__(self, other) -> bool:
         """
-        Checks if two Var objects are equal based on their names
+        Checks if two Var objects are the same kind of variable with the same name and value
         """
-        if isinstance(other, Var):
-            return self.name == other.name
+        if self is other:
+            return True
+        if other.__class__ is self.__class__:
+            return self.name == other.name and self.value == other.value
         return False
 
     def __hash__(self) -> int:
-        return hash(self.name)
+        return self._hash
 
+    # The hash of a str differs between processes, so it is recomputed on unpickling rather than pickled
+    def __getstate__(self) -> dict[str, Any]:
+        return {var_field.name: getattr(self, var_field.name) for var_field in fields(self) if var_field.name != "_hash"}
 
-@dataclass
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._hash = hash(self.name)
+
+
+@dataclass(slots=True, eq=False)
 class IntVar(Var):
 
     lower: float | int = float("-inf")
@@ -62,14 +101,17 @@ class IntVar(Var):
     variation_modes: list[VariationMode] = field(default_factory=lambda: [VariationMode.STARTENDNUM,
                                                                           VariationMode.STARTENDSTEP,
                                                                           VariationMode.NUMS])
+    round_nums: bool = field(init=False, repr=False, default=True)
 
     def __post_init__(self):
-        super().__post_init__()
-        self.round_nums = True
+        Var.__post_init__(self)
         self.expected_type = int
 
     def set_value(self, value: int) -> None:
-        if not isinstance(value, int):
+        # Accepts any integral type, such as NumPy integers, storing it as an int
+        try:
+            value = operator.index(value)
+        except TypeError:
             raise ValueError(f"Value {value} not an integer")
         if not self.lower <= value <= self.upper:
             raise ValueError(f"Value {value} not in range {self.lower} to {self.upper}")
@@ -80,25 +122,27 @@ class IntVar(Var):
         if new_value is not None:
             self.set_value(new_value)
 
-    def __hash__(self) -> int:
-        return hash(self.name)
 
-
-@dataclass
+@dataclass(slots=True, eq=False)
 class FloatVar(Var):
     lower: float | int = float("-inf")
     upper: float | int = float("inf")
     variation_modes: list[VariationMode] = field(default_factory=lambda: [VariationMode.STARTENDNUM,
                                                                           VariationMode.STARTENDSTEP,
                                                                           VariationMode.NUMS])
+    round_nums: bool = field(init=False, repr=False, default=False)
 
     def __post_init__(self):
-        super().__post_init__()
-        self.round_nums = False
+        Var.__post_init__(self)
         self.expected_type = float
 
     def set_value(self, value: float) -> None:
-        if not isinstance(value, float):
+        # Accepts any real number, such as ints and NumPy floats, storing it as a float. Strings are not parsed
+        if isinstance(value, (str, bytes)):
+            raise ValueError(f"Value {value} not a float")
+        try:
+            value = float(value)
+        except TypeError:
             raise ValueError(f"Value {value} not a float")
         if not self.lower <= value <= self.upper:
             raise ValueError(f"Value {value} not in range {self.lower} to {self.upper}")
@@ -119,14 +163,11 @@ class FloatVar(Var):
                 break
             print(f"Value {new_value} not in range {self.lower} to {self.upper}")
 
-    def __hash__(self) -> int:
-        return hash(self.name)
-
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class BoolVar(Var):
     def __post_init__(self):
-        super().__post_init__()
+        Var.__post_init__(self)
         self.expected_type = bool
         self.variation_modes = [VariationMode.BOOLEAN]
 
@@ -146,14 +187,13 @@ class BoolVar(Var):
                 break
             print("Invalid input")
 
-    def __hash__(self) -> int:
-        return hash(self.name)
 
-
-@dataclass
+@dataclass(slots=True, eq=False)
 class BondSelectionVar(Var):
+    _MEMBERS = tuple(BondSelectionProcess)  # Options in the order they are listed in set_value_interactive
+
     def __post_init__(self):
-        super().__post_init__()
+        Var.__post_init__(self)
         self.expected_type = BondSelectionProcess
         self.variation_modes = [VariationMode.BONDSELECTIONPROCESS]
 
@@ -167,16 +207,15 @@ class BondSelectionVar(Var):
                                "1) Random\n2) Weighted\n3) Exit\n", 1, 3)
         if option == 3:
             return
-        self.set_value(list(BondSelectionProcess)[option - 1])
-
-    def __hash__(self) -> int:
-        return hash(self.name)
+        self.set_value(self._MEMBERS[option - 1])
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class StructureTypeVar(Var):
+    _MEMBERS = tuple(StructureType)  # Options in the order they are listed in set_value_interactive
+
     def __post_init__(self):
-        super().__post_init__()
+        Var.__post_init__(self)
         self.expected_type = StructureType
         self.variation_modes = [VariationMode.STRUCTURETYPE]
 
@@ -191,7 +230,4 @@ class StructureTypeVar(Var):
                                "5) BoronNitride\n6) Exit\n", 1, 6)
         if option == 6:
             return
-        self.set_value(StructureType(list(StructureType)[option - 1]))
-
-    def __hash__(self) -> int:
-        return hash(self.name)
+        self.set_value(self._MEMBERS[option - 1])
@@ -1,11 +1,34 @@
 from __future__ import annotations
 from enum import Enum
+from functools import lru_cache
+import math
+import re
 from typing import Type
 from .validation_utils import get_valid_int
 import numpy as np
 from .custom_types import StructureType, BondSelectionProcess, BSSType
 
 
+CSV_SPLIT_PATTERN = re.compile(r"\s*,\s*")  # Splits on commas, trimming the whitespace around them in the same pass
+NEG_INF = -math.inf  # Default lower bound, meaning no lower limit
+POS_INF = math.inf  # Default upper bound, meaning no upper limit
+MAX_INPUT_ATTEMPTS = 100  # Invalid answers allowed before giving up, so scripted input can't loop forever
+NUMPY_PARSE_THRESHOLD = 64  # Number of comma separated numbers from which NumPy parses them faster than float()
+
+
+@lru_cache(maxsize=None)
+def get_enum_members(enum_class: Type[Enum]) -> tuple[Enum, ...]:
+    """
+    Gets the members of an enum in definition order, materialised once per enum since membership never changes
+
+    Args:
+        enum_class: the enum to get the members of
+    Returns:
+        the members of the enum
+    """
+    return tuple(enum_class.__members__.values())
+
+
 class InvalidThreeNumbers(Exception):
     pass
 
@@ -14,6 +37,10 @@ class OutOfRangeError(Exception):
     pass
 
 
+class TooManyAttemptsError(RuntimeError):
+    pass
+
+
 class VariationMode(Enum):
     STARTENDSTEP = "Start, End, Step"
     STARTENDNUM = "Start, End, Number of Steps"
@@ -23,32 +50,33 @@ class VariationMode(Enum):
     BONDSELECTIONPROCESS = "Bond Selection Process"
     STRUCTURETYPE = "Structure Type"
 
-    def get_vary_array(self, lower: int | float = float("-inf"),
-                       upper: int | float = float("inf"),
+    def get_vary_array(self, lower: int | float = NEG_INF,
+                       upper: int | float = POS_INF,
                        round_nums: bool = False) -> list[BSSType]:
-        handlers = {VariationMode.STARTENDSTEP: self._handle_start_end_step,
-                    VariationMode.STARTENDNUM: self._handle_start_end_num,
-                    VariationMode.NUMS: self._handle_nums,
-                    VariationMode.ANYSTRING: self._handle_any_string,
-                    VariationMode.BOOLEAN: self._handle_boolean,
-                    VariationMode.BONDSELECTIONPROCESS: self._handle_bond_selection_process,
-                    VariationMode.STRUCTURETYPE: self._handle_structure_type}
-        handler = handlers.get(self)
+        handler = VARIATION_MODE_HANDLERS.get(self)
         if handler:
-            return handler(lower, upper, round_nums)
+            return handler(self, lower, upper, round_nums)
         else:
             valid_modes = ', '.join(mode.name for mode in VariationMode)
             raise ValueError(f"Invalid variation mode: {self}. Valid modes are: {valid_modes}")
 
-    def _check_in_range_and_round(self, values: list[int | float],
+    def _check_in_range_and_round(self, values: np.ndarray,
                                   round_nums: bool = False,
-                                  lower: int | float = float("-inf"),
-                                  upper: int | float = float("inf")) -> list[int | float]:
+                                  lower: int | float = NEG_INF,
+                                  upper: int | float = POS_INF) -> list[int | float]:
+        # Checked first as NaN would pass the unbounded short-circuit, and NaN and inf have no integer to round to
+        if not np.isfinite(values).all():
+            raise OutOfRangeError("Values must be finite numbers")
+        if not round_nums and lower == NEG_INF and upper == POS_INF:
+            # Nothing to round or compare against
+            return values.tolist()
         if round_nums:
-            values = [round(value) for value in values]
-        if not all(lower <= value <= upper for value in values):
+            # rint rounds halves to even like round, and the cast makes tolist give Python ints
+            values = np.rint(values).astype(np.int64)
+        # Compare every value at once
+        if not np.all((values >= lower) & (values <= upper)):
             raise OutOfRangeError(f"Values not in range: {lower} to {upper}")
-        return values
+        return values.tolist()
 
     def _get_3_nums(self, prompt: str) -> tuple[float, float, float]:
         """
@@ -61,18 +89,18 @@ class VariationMode(Enum):
         Returns:
             tuple[float, float, float]: The 3 numbers entered by the user
         """
-        answer = input(prompt).split(",")
+        answer = CSV_SPLIT_PATTERN.split(input(prompt).strip())
         if len(answer) != 3:
             raise InvalidThreeNumbers("Invalid input, ensure 3 numbers are entered")
         try:
-            return tuple(map(float, (num.strip() for num in answer)))
+            return tuple(map(float, answer))
         except ValueError:
             raise InvalidThreeNumbers("Invalid input, ensure all values are numbers")
 
-    def _handle_start_end_step(self, lower: int | float = float("-inf"),
-                               upper: int | float = float("inf"),
+    def _handle_start_end_step(self, lower: int | float = NEG_INF,
+                               upper: int | float = POS_INF,
                                round_nums: bool = False) -> list[float]:
-        while True:
+        for _ in range(MAX_INPUT_ATTEMPTS):
             try:
                 start, end, step = self._get_3_nums("Enter start, end, and step separated by commas\n")
             except InvalidThreeNumbers as e:
@@ -81,21 +109,23 @@ class VariationMode(Enum):
             if start == end:
                 print("Invalid input, ensure start is not equal to end")
                 continue
-            if step > end - start:
-                print("Invalid input, ensure step is less than end - start")
-                continue
-            if (start < end and step <= 0) or (start > end and step >= 0):
-                print("Invalid input, ensure step is positive for start < end and negative for start > end")
+            # One predicate for ascending and descending ranges: step must point from start towards end
+            # and be no longer than the range
+            span = end - start
+            if not (math.copysign(1.0, step) == math.copysign(1.0, span) and 0 < abs(step) <= abs(span)):
+                print("Invalid input, ensure step is non-zero, no larger than end - start, "
+                      "and positive for start < end or negative for start > end")
                 continue
             try:
-                return self._check_in_range_and_round(list(np.arange(start, end, step)), round_nums, lower, upper)
+                return self._check_in_range_and_round(np.arange(start, end, step), round_nums, lower, upper)
             except OutOfRangeError as e:
                 print(e)
+        raise TooManyAttemptsError(f"No valid input after {MAX_INPUT_ATTEMPTS} attempts")
 
-    def _handle_start_end_num(self, lower: int | float = float("-inf"),
-                              upper: int | float = float("inf"),
+    def _handle_start_end_num(self, lower: int | float = NEG_INF,
+                              upper: int | float = POS_INF,
                               round_nums: bool = False) -> list[float]:
-        while True:
+        for _ in range(MAX_INPUT_ATTEMPTS):
             try:
                 start, end, num = self._get_3_nums("Enter start, end, and number of steps separated by commas\n")
             except InvalidThreeNumbers as e:
@@ -104,7 +134,7 @@ class VariationMode(Enum):
             if start == end:
                 print("Invalid input, ensure start is not equal to end")
                 continue
-            if int(num) != num:
+            if not num.is_integer():
                 print("Invalid input, ensure number of steps is an integer")
                 continue
             num = int(num)
@@ -112,17 +142,23 @@ class VariationMode(Enum):
                 print("Invalid input, ensure number of steps is greater than 0")
                 continue
             try:
-                return self._check_in_range_and_round(list(np.linspace(start, end, num)), round_nums, lower, upper)
+                return self._check_in_range_and_round(np.linspace(start, end, num), round_nums, lower, upper)
             except OutOfRangeError as e:
                 print(e)
+        raise TooManyAttemptsError(f"No valid input after {MAX_INPUT_ATTEMPTS} attempts")
 
-    def _handle_nums(self, lower: int | float = float("-inf"),
-                     upper: int | float = float("inf"),
+    def _handle_nums(self, lower: int | float = NEG_INF,
+                     upper: int | float = POS_INF,
                      round_nums: bool = False) -> list[float]:
-        while True:
+        for _ in range(MAX_INPUT_ATTEMPTS):
             answer = input("Enter numbers separated by commas\n")
+            strings = CSV_SPLIT_PATTERN.split(answer.strip())
             try:
-                values = [float(value.strip()) for value in answer.split(",")]
+                if len(strings) >= NUMPY_PARSE_THRESHOLD:
+                    # Long lists are parsed in a single NumPy conversion, which also rejects non-numbers
+                    values = np.array(strings, dtype=np.float64)
+                else:
+                    values = np.fromiter(map(float, strings), dtype=np.float64, count=len(strings))
             except ValueError:
                 print("Invalid input, ensure all values are numbers")
                 continue
@@ -133,17 +169,16 @@ class VariationMode(Enum):
                 return self._check_in_range_and_round(values, round_nums, lower, upper)
             except OutOfRangeError as e:
                 print(e)
+        raise TooManyAttemptsError(f"No valid input after {MAX_INPUT_ATTEMPTS} attempts")
 
     def _handle_any_string(self, _1, _2, _3) -> list[str]:
-        while True:
+        for _ in range(MAX_INPUT_ATTEMPTS):
             answer = input("Enter strings separated by commas\n")
             strings = [string.strip() for string in answer.split(",")]
-            for string in strings:
-                if not string:
-                    break
-            else:
-                continue
-            return strings
+            if all(strings):
+                return strings
+            print("Invalid input, ensure no strings are empty")
+        raise TooManyAttemptsError(f"No valid input after {MAX_INPUT_ATTEMPTS} attempts")
 
     def _handle_boolean(self, _1, _2, _3) -> list[bool]:
         return [True, False]
@@ -155,23 +190,37 @@ class VariationMode(Enum):
         return self._handle_enum_selection(StructureType)
 
     def _handle_enum_selection(self, enum_class: Type[Enum]) -> list[Enum]:
-        selected_values = {mode: False for mode in enum_class.__members__.values()}
-        confirm_num = len(enum_class) + 1
-        while True:
-            prompt: str = "Please select the values you would like to add to your vary array\n"
-            counter: int = 0
-            for mode, selected in selected_values.items():
-                counter += 1
-                if selected:
-                    prompt += f"[*] {counter}) {mode.value}\n"
-                    continue
-                prompt += f"[ ] {counter}) {mode.value}\n"
-            prompt += f"{confirm_num}) Confirm\n"
+        members = get_enum_members(enum_class)
+        selected = bytearray(len(members))
+        confirm_num = len(members) + 1
+        # Only the [*]/[ ] prefix changes between prompts, so the rest of each line is formatted once
+        header = "Please select the values you would like to add to your vary array\n"
+        labels = [f" {i + 1}) {mode.value}\n" for i, mode in enumerate(members)]
+        confirm_line = f"{confirm_num}) Confirm\n"
+        # Toggling a value is a valid answer, so only confirming too few values counts towards the limit
+        rejections = 0
+        while rejections < MAX_INPUT_ATTEMPTS:
+            prompt: str = "".join([header,
+                                   *(("[*]" if is_selected else "[ ]") + label for is_selected, label in zip(selected, labels)),
+                                   confirm_line])
             option = get_valid_int(prompt, 1, confirm_num)
             if option == confirm_num:
-                vary_array = [mode for mode, selected in selected_values.items() if selected]
+                vary_array = [mode for mode, is_selected in zip(members, selected) if is_selected]
                 if len(vary_array) < 2:
                     print("Please select at least 2 values")
+                    rejections += 1
                     continue
                 return vary_array
-            selected_values[list(selected_values.keys())[option - 1]] = not selected_values[list(selected_values.keys())[option - 1]]
+            selected[option - 1] ^= 1
+        raise TooManyAttemptsError(f"No valid input after {MAX_INPUT_ATTEMPTS} attempts")
+
+
+# Built once at import time rather than on every get_vary_array call. It lives outside the class
+# because attributes assigned in an Enum body would become members
+VARIATION_MODE_HANDLERS = {VariationMode.STARTENDSTEP: VariationMode._handle_start_end_step,
+                           VariationMode.STARTENDNUM: VariationMode._handle_start_end_num,
+                           VariationMode.NUMS: VariationMode._handle_nums,
+                           VariationMode.ANYSTRING: VariationMode._handle_any_string,
+                           VariationMode.BOOLEAN: VariationMode._handle_boolean,
+                           VariationMode.BONDSELECTIONPROCESS: VariationMode._handle_bond_selection_process,
+                           VariationMode.STRUCTURETYPE: VariationMode._handle_structure_type}